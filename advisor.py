@@ -0,0 +1,123 @@
+"""
+Which debater to call.
+
+Ranks every available, uncommitted attacker on a side by
+
+    expected spaces converted - loss_weight * P(attacker burned/disgraced) * attacker value
+
+averaged over the defenders the attacker could face. Those are the
+available debaters of the other side in the current filter, picked uniformly,
+as the GUI does. Expected spaces are net: a lost debate converts spaces the
+other way and counts against the attacker. Probabilities are exact. With a
+MatchupTable (see matchup_table) the ranking is a few array lookups;
+otherwise, e.g. with bonus dice, it falls back to the memoised margin PMFs
+and still takes only milliseconds.
+"""
+import numpy as np
+
+import profiling
+from debate_engine import DebateModifiers, DebateState
+from debate_odds import exact_odds
+from matchup_table import (EXPECTED_MARGIN, P_PAPAL_DISGRACED, P_PAPAL_WIN, P_PROTESTANT_BURNED,
+                           P_PROTESTANT_WIN, PAPAL_ATTACKS, PROTESTANT_ATTACKS)
+
+
+class Advice:
+    """Ranking entry for one attacker."""
+
+    def __init__(self, debater, row, score, expected_spaces, p_lost, p_win):
+        self.debater = debater
+        self.row = row
+        self.score = score
+        self.expected_spaces = expected_spaces  # net, from the attacker's side
+        self.p_lost = p_lost  # chance the attacker is burned/disgraced
+        self.p_win = p_win
+
+    def __repr__(self):
+        return f"Advice({self.debater.name}, score={self.score:+.2f})"
+
+
+@profiling.traced("advisor.rank_attackers")
+def rank_attackers(roster, protestant_attacking, mask=None, modifiers=None, loss_weight=1.0,
+                   table=None):
+    """
+    Rank the attackers of one side. Returns a list of Advice, best first;
+    empty if that side has no attacker or the other side no defender.
+    table is an optional MatchupTable read from when it covers the modifiers.
+    """
+    modifiers = modifiers if modifiers is not None else DebateModifiers()
+    registry = roster.registry
+    attacker_rows = roster.candidates(protestant_attacking, mask, uncommitted=True).tolist()
+    defender_rows = roster.candidates(not protestant_attacking, mask).tolist()
+    if not attacker_rows or not defender_rows:
+        return []
+
+    averages = None
+    if table is not None and table.covers(modifiers):
+        averages = _table_averages(table, roster, protestant_attacking, attacker_rows,
+                                   defender_rows, modifiers.flags)
+    if averages is not None:
+        ranking = []
+        for attacker_row, spaces, lost, wins in zip(attacker_rows, *averages):
+            attacker = registry.at_row(attacker_row)
+            score = spaces - loss_weight * lost * attacker.debate_value
+            ranking.append(Advice(attacker, attacker_row, score, spaces, lost, wins))
+        ranking.sort(key=lambda advice: -advice.score)
+        return ranking
+
+    ranking = []
+    for attacker_row in attacker_rows:
+        attacker = registry.at_row(attacker_row)
+        spaces = lost = wins = 0.0
+        for defender_row in defender_rows:
+            defender = registry.at_row(defender_row)
+            protestant, papal = (attacker, defender) if protestant_attacking else (defender, attacker)
+            odds = exact_odds(DebateState(protestant, papal, protestant_attacking,
+                                          defender_committed=bool(roster.committed[defender_row]),
+                                          modifiers=modifiers))
+            if protestant_attacking:
+                spaces += odds.expected_margin
+                lost += odds.p_protestant_burned
+                wins += odds.p_protestant_win
+            else:
+                spaces -= odds.expected_margin
+                lost += odds.p_papal_disgraced
+                wins += odds.p_papal_win
+
+        n = len(defender_rows)
+        spaces, lost, wins = spaces / n, lost / n, wins / n
+        score = spaces - loss_weight * lost * attacker.debate_value
+        ranking.append(Advice(attacker, attacker_row, score, spaces, lost, wins))
+
+    ranking.sort(key=lambda advice: -advice.score)
+    return ranking
+
+
+def _table_averages(table, roster, protestant_attacking, attacker_rows, defender_rows, flags):
+    """
+    Per-attacker (spaces, lost, wins) lists averaged over the defenders, read
+    from the table; None if a debater is not in it.
+    """
+    registry = roster.registry
+    try:
+        attackers = table.indices([registry.at_row(r) for r in attacker_rows], protestant_attacking)
+        defenders = table.indices([registry.at_row(r) for r in defender_rows],
+                                  not protestant_attacking)
+    except KeyError:
+        return None
+    committed = roster.committed[defender_rows].astype(np.intp)
+
+    # [attacker, defender, field]
+    if protestant_attacking:
+        cells = table.table[flags, PROTESTANT_ATTACKS][
+            committed[None, :], attackers[:, None], defenders[None, :]]
+        spaces = cells[:, :, EXPECTED_MARGIN]
+        lost, wins = P_PROTESTANT_BURNED, P_PROTESTANT_WIN
+    else:
+        cells = table.table[flags, PAPAL_ATTACKS][
+            committed[None, :], defenders[None, :], attackers[:, None]]
+        spaces = -cells[:, :, EXPECTED_MARGIN]
+        lost, wins = P_PAPAL_DISGRACED, P_PAPAL_WIN
+    return (spaces.mean(axis=1, dtype=np.float64).tolist(),
+            cells[:, :, lost].mean(axis=1, dtype=np.float64).tolist(),
+            cells[:, :, wins].mean(axis=1, dtype=np.float64).tolist())
@@ -0,0 +1,180 @@
+"""
+Benchmarks for the resolution, filtering and simulation hot paths.
+
+    python benchmarks/bench_hotpaths.py                          # just report
+    python benchmarks/bench_hotpaths.py --save-baseline base.json
+    python benchmarks/bench_hotpaths.py --baseline base.json --threshold 0.25
+
+Each benchmark reports ops/sec (best of several timed rounds) and the peak
+memory allocated during one call. With --baseline, any benchmark whose
+ops/sec drops more than --threshold below the baseline fails the run.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+import debate_odds
+from debate_engine import DebateModifiers, DebateState, resolve_debate
+from debate_montecarlo import adaptive_odds, estimate_odds
+from debaters import (CATHOLIC, ENGLISH, FRENCH, GERMAN, Debater,
+                      DebaterRegistry, registry)
+from roster import RosterArrays
+from zone_sweep import sweep_zones
+
+SYNTHETIC_ROSTER_SIZES = (1_000, 100_000)
+MONTE_CARLO_TRIALS = (10_000, 100_000, 1_000_000)
+ADAPTIVE_HALF_WIDTHS = (0.01, 0.002)
+
+
+def synthetic_registry(n, seed=0):
+    """A registry of n made-up debaters spread over all zones and turns 1-9."""
+    rng = random.Random(seed)
+    zones = [GERMAN, ENGLISH, CATHOLIC, FRENCH]
+    return DebaterRegistry(
+        Debater(f"Debater{i}", rng.randint(1, 9), rng.randint(1, 4), rng.choice(zones),
+                optional=rng.random() < 0.1)
+        for i in range(n)
+    )
+
+
+def benchmarks():
+    """{name: zero-argument callable} for every hot path."""
+    rng = random.Random(1)
+    np_rng = np.random.default_rng(1)
+    luther, eck = registry["Luther"], registry["Eck"]
+    state = DebateState(luther, eck, True, modifiers=DebateModifiers(augsburg=True))
+
+    cases = {
+        "resolve_debate": lambda: resolve_debate(state, rng),
+    }
+
+    for n in SYNTHETIC_ROSTER_SIZES:
+        roster = RosterArrays(synthetic_registry(n))
+        turn = iter(range(10**9))
+        # The zone/turn filter behind filter_debaters_table
+        cases[f"filter_roster[{n}]"] = lambda r=roster, t=turn: r.visible_mask(FRENCH, next(t) % 9 + 1)
+        # select_attacker: eligible rows, then a uniform pick
+        mask = roster.visible_mask(GERMAN, 6)
+
+        def select(r=roster, m=mask):
+            rows = r.candidates(True, m, uncommitted=True)
+            return rows[rng.randrange(rows.size)]
+
+        cases[f"select_attacker[{n}]"] = select
+
+    filter_proxy = qt_filter_benchmark()
+    if filter_proxy is not None:
+        cases["filter_debaters_table[qt]"] = filter_proxy
+
+    for trials in MONTE_CARLO_TRIALS:
+        cases[f"monte_carlo[{trials}]"] = (
+            lambda t=trials: estimate_odds(state, trials=t, rng=np_rng))
+    for half_width in ADAPTIVE_HALF_WIDTHS:
+        cases[f"monte_carlo_adaptive[{half_width}]"] = (
+            lambda w=half_width: adaptive_odds(state, half_width=w, rng=np_rng))
+
+    def exact_cold():
+        debate_odds.hits_pmf.cache_clear()
+        debate_odds.margin_pmf.cache_clear()
+        return debate_odds.exact_odds(state).p_protestant_win
+
+    cases["exact_odds[cold]"] = exact_cold
+    cases["exact_odds[warm]"] = lambda: debate_odds.exact_odds(state).p_protestant_win
+    cases["exact_all_matchups"] = lambda: list(debate_odds.all_matchup_odds())
+    cases["zone_sweep"] = lambda: sweep_zones(RosterArrays(registry))
+    return cases
+
+
+def qt_filter_benchmark():
+    """The GUI's proxy filter on a large roster, if PyQt6 is installed."""
+    try:
+        from PyQt6.QtWidgets import QApplication
+    except ImportError:
+        return None
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from debater_table_model import DebaterFilterProxy, DebaterTableModel
+
+    app = QApplication.instance() or QApplication([])
+    roster = RosterArrays(synthetic_registry(SYNTHETIC_ROSTER_SIZES[0]))
+    model = DebaterTableModel(roster)
+    proxy = DebaterFilterProxy(roster)
+    proxy.setSourceModel(model)
+    turn = iter(range(10**9))
+    qt_filter_benchmark.keep_alive = (app, model, proxy)
+    return lambda: proxy.set_filter(GERMAN, next(turn) % 9 + 1)
+
+
+def measure(func, min_time=0.2, rounds=3):
+    """(ops/sec, peak bytes) for func()."""
+    func()  # warm up
+    best = 0.0
+    for _ in range(rounds):
+        calls = 0
+        start = time.perf_counter()
+        while True:
+            func()
+            calls += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        best = max(best, calls / elapsed)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--baseline", help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", help="write this run's results as a baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed fractional drop in ops/sec before failing (default 0.25)")
+    parser.add_argument("--filter", default="", help="only run benchmarks containing this text")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per timed round")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+
+    results = {}
+    regressions = []
+    for name, func in benchmarks().items():
+        if args.filter not in name:
+            continue
+        ops, peak = measure(func, args.min_time)
+        results[name] = {"ops_per_sec": ops, "peak_bytes": peak}
+        line = f"{name:28s} {ops:14,.1f} ops/s  peak {peak / 1024:10,.1f} KiB"
+        if name in baseline:
+            change = ops / baseline[name]["ops_per_sec"] - 1
+            line += f"  {change:+7.1%} vs baseline"
+            if change < -args.threshold:
+                line += "  REGRESSION"
+                regressions.append(name)
+        print(line)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "numpy": np.__version__,
+                       "results": results}, f, indent=2)
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed more than {args.threshold:.0%}: "
+              + ", ".join(regressions))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+Cold-start benchmark.
+
+Times fresh interpreter processes for:
+  interpreter     python -c pass (the floor everything else sits on)
+  headless_import importing the resolver and the rules/simulation modules
+  first_window    importing the GUI and getting the first window shown
+
+and compares the medians against startup_budget.json. Exits non-zero if
+any stage is over budget, so it can run in CI:
+
+    python benchmarks/bench_startup.py [--repeat 5] [--json out.json]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "startup_budget.json")
+
+HEADLESS_IMPORT = """
+import debate_resolver, debate_engine, debate_odds, debate_montecarlo, campaign, debate_cli
+assert "PyQt6" not in __import__("sys").modules, "PyQt6 was imported on the headless path"
+"""
+
+FIRST_WINDOW = """
+import sys
+from PyQt6.QtWidgets import QApplication
+from debate_window import DebateResolverWindow
+app = QApplication(sys.argv)
+window = DebateResolverWindow()
+window.show()
+app.processEvents()
+"""
+
+STAGES = {
+    "interpreter": "pass",
+    "headless_import": HEADLESS_IMPORT,
+    "first_window": FIRST_WINDOW,
+}
+
+
+def time_stage(code):
+    """Wall time in ms of a fresh `python -c code` run from the repo root."""
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")  # no display needed
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return (time.perf_counter() - start) * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="runs per stage; the median is used")
+    parser.add_argument("--json", help="also write the results to this file")
+    parser.add_argument("--budget", default=BUDGET_FILE, help="budget file (ms per stage)")
+    args = parser.parse_args(argv)
+
+    with open(args.budget, encoding="utf-8") as f:
+        budget = json.load(f)
+
+    results = {}
+    over_budget = []
+    for stage, code in STAGES.items():
+        try:
+            times = [time_stage(code) for _ in range(args.repeat)]
+        except subprocess.CalledProcessError:
+            print(f"{stage:16s} FAILED")
+            over_budget.append(stage)
+            continue
+        median = statistics.median(times)
+        results[stage] = {"median_ms": round(median, 1), "min_ms": round(min(times), 1)}
+        limit = budget.get(stage)
+        status = ""
+        if limit is not None:
+            status = "ok" if median <= limit else "OVER BUDGET"
+            if median > limit:
+                over_budget.append(stage)
+        print(f"{stage:16s} median {median:8.1f} ms  min {min(times):8.1f} ms"
+              f"  budget {limit if limit is not None else '-':>6} ms  {status}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
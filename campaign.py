@@ -0,0 +1,199 @@
+"""
+Whole-game debate campaigns.
+
+Plays the debate subsystem over game turns 1..N: debaters come in as their
+turn arrives (optional English debaters only if asked for), both debaters
+are committed after each debate, burned/disgraced debaters leave play and
+commitment resets at the start of every turn like "Reset All Committed".
+run_campaigns() plays many independent, seeded campaigns and reports the
+spread of spaces converted and how often each debater survives.
+"""
+import random
+
+import numpy as np
+
+import profiling
+from debate_engine import PAPAL, PROTESTANT, DebateModifiers, DebateState, play_debate
+from debaters import registry
+from roster import RosterArrays
+
+
+def random_choice(rows, roster, rng):
+    """Default strategy: any eligible debater, uniformly."""
+    return rows[rng.randrange(len(rows))]
+
+
+class CampaignSettings:
+    """
+    How a campaign is played.
+
+    calls_per_turn: (protestant_calls, papal_calls) made each turn
+    optional_debaters: names of optional debaters brought into play;
+                       ValueError for a name not in the registry
+    modifiers: DebateModifiers, or a function turn -> DebateModifiers
+    choose_attacker / choose_defender: strategy(rows, roster, rng) -> row
+    """
+
+    def __init__(self, turns=9, calls_per_turn=(2, 2), optional_debaters=(),
+                 modifiers=None, choose_attacker=random_choice, choose_defender=random_choice,
+                 registry=registry):
+        self.turns = turns
+        self.calls_per_turn = calls_per_turn
+        self.optional_debaters = tuple(optional_debaters)
+        for name in self.optional_debaters:
+            if registry.row_of(name) is None:
+                raise ValueError(f"Unknown debater {name!r}")
+        self.modifiers = modifiers if modifiers is not None else DebateModifiers()
+        self.choose_attacker = choose_attacker
+        self.choose_defender = choose_defender
+        self.registry = registry
+
+    def modifiers_for(self, turn):
+        return self.modifiers(turn) if callable(self.modifiers) else self.modifiers
+
+
+class CampaignResult:
+    """Totals from one campaign."""
+
+    def __init__(self, protestant_spaces, catholic_spaces, entered, eliminated, debates):
+        self.protestant_spaces = protestant_spaces
+        self.catholic_spaces = catholic_spaces
+        self.entered = entered        # bool per roster row: came into play
+        self.eliminated = eliminated  # bool per roster row: burned or disgraced
+        self.debates = debates
+
+
+@profiling.traced("sim.play_campaign")
+def play_campaign(settings, rng):
+    """Play one campaign with a random.Random-like rng."""
+    roster = RosterArrays(settings.registry)
+    optional_rows = [settings.registry.row_of(name) for name in settings.optional_debaters]
+    roster.available[optional_rows] = True
+
+    protestant_spaces = catholic_spaces = debates = 0
+    eliminated = np.zeros(len(roster), dtype=bool)
+    protestant_calls, papal_calls = settings.calls_per_turn
+
+    for turn in range(1, settings.turns + 1):
+        roster.reset_committed()
+        in_play = roster.turn <= turn
+        modifiers = settings.modifiers_for(turn)
+
+        # Alternate Protestant and Papal calls while either side has some left
+        sides = []
+        for i in range(max(protestant_calls, papal_calls)):
+            if i < protestant_calls:
+                sides.append(True)
+            if i < papal_calls:
+                sides.append(False)
+
+        for protestant_attacking in sides:
+            attackers = roster.candidates(protestant_attacking, in_play, uncommitted=True)
+            defenders = roster.candidates(not protestant_attacking, in_play)
+            if not attackers.size or not defenders.size:
+                continue
+            attacker_row = settings.choose_attacker(attackers, roster, rng)
+            defender_row = settings.choose_defender(defenders, roster, rng)
+
+            attacker = settings.registry.at_row(attacker_row)
+            defender = settings.registry.at_row(defender_row)
+            protestant, papal = (attacker, defender) if protestant_attacking else (defender, attacker)
+            state = DebateState(protestant, papal, protestant_attacking,
+                                defender_committed=bool(roster.committed[defender_row]),
+                                modifiers=modifiers)
+            winner, margin, loser_eliminated = play_debate(state, rng)
+            debates += 1
+
+            if winner == PROTESTANT:
+                protestant_spaces += margin
+            elif winner == PAPAL:
+                catholic_spaces += margin
+            if loser_eliminated:
+                loser = papal if winner == PROTESTANT else protestant
+                loser_row = settings.registry.row_of(loser.name)
+                roster.available[loser_row] = False
+                eliminated[loser_row] = True
+
+            roster.committed[attacker_row] = True
+            roster.committed[defender_row] = True
+
+    brought_in = ~roster.optional
+    brought_in[optional_rows] = True
+    entered = brought_in & (roster.turn <= settings.turns)
+    return CampaignResult(protestant_spaces, catholic_spaces, entered, eliminated, debates)
+
+
+def campaign_rng(seed_seq, index):
+    """Independent random.Random for campaign `index`; depends only on the root seed and index."""
+    child = np.random.SeedSequence(seed_seq.entropy, spawn_key=seed_seq.spawn_key + (index,))
+    return random.Random(int(child.generate_state(1, np.uint64)[0]))
+
+
+class CampaignSummary:
+    """Distributions over many campaigns."""
+
+    def __init__(self, registry, protestant_spaces, catholic_spaces, entered_counts,
+                 eliminated_counts, entropy=None):
+        self.registry = registry
+        self.protestant_spaces = protestant_spaces  # int array, one per campaign
+        self.catholic_spaces = catholic_spaces
+        self.entered_counts = entered_counts        # per roster row
+        self.eliminated_counts = eliminated_counts
+        self.entropy = entropy  # root seed, to reproduce the run
+
+    @classmethod
+    def from_results(cls, registry, results, entropy=None):
+        n = len(registry)
+        entered = np.zeros(n, dtype=np.int64)
+        eliminated = np.zeros(n, dtype=np.int64)
+        for r in results:
+            entered += r.entered
+            eliminated += r.eliminated
+        return cls(registry,
+                   np.array([r.protestant_spaces for r in results], dtype=np.int64),
+                   np.array([r.catholic_spaces for r in results], dtype=np.int64),
+                   entered, eliminated, entropy)
+
+    @property
+    def campaigns(self):
+        return self.protestant_spaces.size
+
+    @property
+    def net_spaces(self):
+        """Protestant minus Catholic conversions per campaign."""
+        return self.protestant_spaces - self.catholic_spaces
+
+    def survival_rates(self):
+        """{name: fraction of campaigns the debater was in play and never eliminated}."""
+        rates = {}
+        for row, d in enumerate(self.registry):
+            if self.entered_counts[row]:
+                rates[d.name] = 1 - self.eliminated_counts[row] / self.entered_counts[row]
+        return rates
+
+    def summary(self):
+        """Log lines describing the distributions."""
+        lines = [f"{self.campaigns:,} campaigns"]
+        for label, spaces in (("Protestant", self.protestant_spaces),
+                              ("Catholic", self.catholic_spaces),
+                              ("Net Protestant", self.net_spaces)):
+            p5, p50, p95 = np.percentile(spaces, [5, 50, 95])
+            lines.append(f"{label} spaces: mean {spaces.mean():.2f}, "
+                         f"median {p50:g}, 5-95% {p5:g}..{p95:g}")
+        rates = sorted(self.survival_rates().items(), key=lambda item: item[1])
+        lines.append("Survival: " + ", ".join(f"{name} {rate:.0%}" for name, rate in rates))
+        return lines
+
+
+@profiling.traced("sim.run_campaigns")
+def run_campaigns(n, settings=None, seed=None):
+    """Play n independent campaigns and summarise them."""
+    settings = settings if settings is not None else CampaignSettings()
+    seed_seq = np.random.SeedSequence(seed)
+    results = [play_campaign(settings, campaign_rng(seed_seq, i)) for i in range(n)]
+    return CampaignSummary.from_results(settings.registry, results, seed_seq.entropy)
+
+
+if __name__ == "__main__":
+    for line in run_campaigns(1000, seed=1).summary():
+        print(line)
@@ -0,0 +1,80 @@
+"""
+Resolve debates from the command line, without the GUI.
+
+Reads one scenario per line (JSON Lines, see scenarios.py) from a file or
+stdin and writes one JSON result per line to stdout:
+
+    python debate_cli.py games.jsonl --mode odds > odds.jsonl
+    echo '{"attacker": "Luther", "defender": "Eck"}' | python debate_cli.py --seed 1
+    python debate_cli.py games.jsonl --rules house_rules.json
+
+PyQt6 is never imported on this path.
+"""
+import argparse
+import json
+import random
+import sys
+
+from debate_engine import resolve_debate
+from debate_odds import exact_odds
+from rules import DEFAULT_RULES, RulesError, load_rules
+from scenarios import ScenarioError, odds_record, result_record, scenario_state
+
+
+def process_line(line, mode, rng, rules=DEFAULT_RULES):
+    """Return the output record for one input line (an error record if it is bad)."""
+    scenario = {}
+    try:
+        scenario = json.loads(line)
+        if not isinstance(scenario, dict):
+            scenario = {}
+            raise ScenarioError("Scenario must be a JSON object")
+        state = scenario_state(scenario, rules=rules)
+        if mode == "odds":
+            record = odds_record(state, exact_odds(state))
+        else:
+            record = result_record(state, resolve_debate(state, rng))
+    except (ValueError, TypeError) as e:
+        record = {"error": str(e)}
+    except Exception as e:  # one bad debate must not end the batch
+        record = {"error": f"{type(e).__name__}: {e}"}
+    if "id" in scenario:
+        record = {"id": scenario["id"], **record}
+    return record
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resolve Here I Stand debates from JSON Lines.")
+    parser.add_argument("input", nargs="?", default="-",
+                        help="scenario file, one JSON object per line (default: stdin)")
+    parser.add_argument("--mode", choices=["resolve", "odds"], default="resolve",
+                        help="roll each debate, or compute its exact odds")
+    parser.add_argument("--seed", type=int, default=None, help="seed for reproducible rolls")
+    parser.add_argument("--rules", default=None,
+                        help="event modifier rules file (default: modifiers.json)")
+    args = parser.parse_args(argv)
+
+    try:
+        rules = load_rules(args.rules) if args.rules else DEFAULT_RULES
+    except (OSError, RulesError) as e:
+        parser.error(str(e))
+
+    rng = random.Random(args.seed)
+    infile = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    errors = 0
+    try:
+        write = sys.stdout.write
+        for line in infile:
+            if not line.strip():
+                continue
+            record = process_line(line, args.mode, rng, rules)
+            errors += "error" in record
+            write(json.dumps(record) + "\n")
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,266 @@
+"""
+Headless debate resolution for Here I Stand.
+
+Everything in here is plain Python so it can be used without PyQt6: the GUI
+in debate_window.py builds a DebateState from its widgets and hands it to
+resolve_debate(), and analysis tools can do the same thing in a loop.
+"""
+import random
+
+import profiling
+from debaters import CATHOLIC
+from rules import DEFAULT_RULES
+
+PROTESTANT = "Protestant"
+PAPAL = "Papal"
+
+ATTACKER_BONUS = 3
+DEFENDER_BONUS = 2
+COMMITTED_DEFENDER_BONUS = 1
+
+
+class DebateModifiers:
+    """
+    Event cards and bonus dice in play for a debate. Events are rule ids of
+    the rule set, e.g. DebateModifiers(augsburg=True, mary=True).
+    """
+
+    def __init__(self, protestant_bonus=0, papal_bonus=0, rules=None, flags=0, **events):
+        self.rules = rules if rules is not None else DEFAULT_RULES
+        for rule_id, active in events.items():
+            try:
+                flag = self.rules.flag(rule_id)
+            except KeyError:
+                raise TypeError(f"Unknown event for {self.rules.name}: {rule_id!r}") from None
+            flags = flags | flag if active else flags & ~flag
+        self.flags = flags  # event-flag bitmask; bonus dice are not included
+        self.protestant_bonus = protestant_bonus
+        self.papal_bonus = papal_bonus
+
+    @classmethod
+    def from_flags(cls, flags, protestant_bonus=0, papal_bonus=0, rules=None):
+        """Build modifiers from an event-flag bitmask of the rule set (see RuleSet.flag)."""
+        return cls(protestant_bonus, papal_bonus, rules=rules, flags=flags)
+
+    def is_active(self, rule_id):
+        return bool(self.flags & self.rules.flag(rule_id))
+
+    @property
+    def events(self):
+        """Ids of the rules in play, in rule-set order."""
+        return self.rules.ids_for(self.flags)
+
+
+class DebateState:
+    """A single debate: who is debating, who attacks and which events apply."""
+
+    def __init__(self, protestant, papal, protestant_attacking,
+                 defender_committed=False, modifiers=None):
+        self.protestant = protestant
+        self.papal = papal
+        self.protestant_attacking = protestant_attacking
+        self.defender_committed = defender_committed
+        self.modifiers = modifiers if modifiers is not None else DebateModifiers()
+
+    @property
+    def attacker(self):
+        return self.protestant if self.protestant_attacking else self.papal
+
+    @property
+    def defender(self):
+        return self.papal if self.protestant_attacking else self.protestant
+
+
+class DebateResult:
+    """Outcome of a resolved debate, plus the log lines describing it."""
+
+    def __init__(self, protestant_dice, papal_dice, protestant_rolls, papal_rolls,
+                 winner, margin, loser_eliminated, log):
+        self.protestant_dice = protestant_dice
+        self.papal_dice = papal_dice
+        self.protestant_rolls = protestant_rolls
+        self.papal_rolls = papal_rolls
+        self.winner = winner  # PROTESTANT, PAPAL or None for a tie
+        self.margin = margin
+        self.loser_eliminated = loser_eliminated
+        self.log = log
+
+    @property
+    def protestant_hits(self):
+        return count_hits(self.protestant_rolls)
+
+    @property
+    def papal_hits(self):
+        return count_hits(self.papal_rolls)
+
+    @property
+    def protestant_burned(self):
+        return self.winner == PAPAL and self.loser_eliminated
+
+    @property
+    def papal_disgraced(self):
+        return self.winner == PROTESTANT and self.loser_eliminated
+
+    @property
+    def spaces_converted(self):
+        return self.margin
+
+
+class DebateOdds:
+    """
+    Outcome probabilities for a debate, built from the distribution of the
+    signed margin (protestant hits - papal hits).
+    """
+
+    def __init__(self, margin_probs, protestant_value, papal_value, trials=None,
+                 precision=None, confidence=None):
+        self.margin_probs = margin_probs  # {margin: probability}
+        self.protestant_value = protestant_value
+        self.papal_value = papal_value
+        self.trials = trials  # None for exact odds
+        # Widest confidence-interval half-width of the win/burn/disgrace
+        # probabilities, for adaptive estimates (see debate_montecarlo)
+        self.precision = precision
+        self.confidence = confidence
+
+    @property
+    def p_protestant_win(self):
+        return sum((p for m, p in self.margin_probs.items() if m > 0), 0.0)
+
+    @property
+    def p_tie(self):
+        return self.margin_probs.get(0, 0.0)
+
+    @property
+    def p_papal_win(self):
+        return sum((p for m, p in self.margin_probs.items() if m < 0), 0.0)
+
+    @property
+    def p_papal_disgraced(self):
+        return sum((p for m, p in self.margin_probs.items() if m > self.papal_value), 0.0)
+
+    @property
+    def p_protestant_burned(self):
+        return sum((p for m, p in self.margin_probs.items() if -m > self.protestant_value), 0.0)
+
+    @property
+    def expected_margin(self):
+        """Expected spaces converted, positive towards the Protestant."""
+        return sum(m * p for m, p in self.margin_probs.items())
+
+    def summary(self):
+        """Log lines describing the odds."""
+        source = f"{self.trials:,} simulated debates" if self.trials else "exact"
+        if self.precision is not None:
+            source += f", ±{self.precision:.2%} at {self.confidence:.0%} confidence"
+        return [
+            f"Odds ({source}):",
+            f"Protestant wins {self.p_protestant_win:.1%}, tie {self.p_tie:.1%}, "
+            f"Papal wins {self.p_papal_win:.1%}",
+            f"Papal debater disgraced {self.p_papal_disgraced:.1%}, "
+            f"Protestant debater burned {self.p_protestant_burned:.1%}",
+            f"Expected margin {self.expected_margin:+.2f} (positive = Protestant)",
+        ]
+
+
+def is_protestant(debater):
+    return debater.language_zone != CATHOLIC
+
+
+def count_hits(rolls):
+    """Rolls of 5 or 6 are hits."""
+    return sum(1 for x in rolls if x >= 5)
+
+
+def dice_pools(state):
+    """
+    Work out how many dice each side rolls.
+    Returns (protestant_dice, papal_dice, log) where log explains each modifier.
+    """
+    mods = state.modifiers
+    log = []
+    protestant_dice = state.protestant.debate_value
+    papal_dice = state.papal.debate_value
+
+    defender_bonus = COMMITTED_DEFENDER_BONUS if state.defender_committed else DEFENDER_BONUS
+    if state.protestant_attacking:
+        protestant_dice += ATTACKER_BONUS
+        papal_dice += defender_bonus
+        log.append(f"Protestant is attacking (+{ATTACKER_BONUS} dice)")
+        log.append(f"Papal is defending (+{defender_bonus} dice)")
+    else:
+        papal_dice += ATTACKER_BONUS
+        protestant_dice += defender_bonus
+        log.append(f"Papal is attacking (+{ATTACKER_BONUS} dice)")
+        log.append(f"Protestant is defending (+{defender_bonus} dice)")
+
+    # Event cards and house rules, see rules.py
+    rule_protestant, rule_papal, rule_log = mods.rules.dice_delta(
+        state.protestant, state.papal, state.protestant_attacking, mods.flags)
+    protestant_dice += rule_protestant
+    papal_dice += rule_papal
+    log.extend(rule_log)
+
+    protestant_dice += mods.protestant_bonus
+    papal_dice += mods.papal_bonus
+
+    # Each side must roll at least 1 die
+    return max(1, protestant_dice), max(1, papal_dice), log
+
+
+def judge(state, protestant_hits, papal_hits):
+    """
+    Decide the winner from the hit counts.
+    The loser is burned/disgraced if the margin exceeds their debate value.
+    Returns (winner, margin, loser_eliminated).
+    """
+    if protestant_hits > papal_hits:
+        margin = protestant_hits - papal_hits
+        return PROTESTANT, margin, margin > state.papal.debate_value
+    if papal_hits > protestant_hits:
+        margin = papal_hits - protestant_hits
+        return PAPAL, margin, margin > state.protestant.debate_value
+    return None, 0, False
+
+
+def play_debate(state, rng=random):
+    """
+    resolve_debate() without the log or individual rolls, for simulations.
+    Returns (winner, margin, loser_eliminated).
+    """
+    protestant_dice, papal_dice, _ = dice_pools(state)
+    profiling.count("engine.rolls", protestant_dice + papal_dice)
+    protestant_hits = sum(1 for _ in range(protestant_dice) if rng.randint(1, 6) >= 5)
+    papal_hits = sum(1 for _ in range(papal_dice) if rng.randint(1, 6) >= 5)
+    return judge(state, protestant_hits, papal_hits)
+
+
+@profiling.traced("engine.resolve_debate")
+def resolve_debate(state, rng=random):
+    """Roll a debate and return a DebateResult. rng needs a randint() method."""
+    protestant_dice, papal_dice, log = dice_pools(state)
+    profiling.count("engine.rolls", protestant_dice + papal_dice)
+
+    protestant_rolls = [rng.randint(1, 6) for _ in range(protestant_dice)]
+    papal_rolls = [rng.randint(1, 6) for _ in range(papal_dice)]
+    protestant_hits = count_hits(protestant_rolls)
+    papal_hits = count_hits(papal_rolls)
+    log.append(f"Protestant dice ({protestant_dice}): {protestant_rolls} => {protestant_hits} hits")
+    log.append(f"Papal dice ({papal_dice}): {papal_rolls} => {papal_hits} hits")
+
+    winner, margin, loser_eliminated = judge(state, protestant_hits, papal_hits)
+    if winner == PROTESTANT:
+        log.append(f"Protestant wins by {margin}")
+        log.append("Papal debater is DISGRACED!" if loser_eliminated
+                   else "No effect on Papal debater.")
+        log.append(f"{margin} space(s) converted to Protestant.")
+    elif winner == PAPAL:
+        log.append(f"Papal wins by {margin}")
+        log.append("Protestant debater is BURNED at the stake!" if loser_eliminated
+                   else "No effect on Protestant debater.")
+        log.append(f"{margin} space(s) converted to Catholic.")
+    else:
+        log.append("Tie! (Possible second round or no effect)")
+
+    return DebateResult(protestant_dice, papal_dice, protestant_rolls, papal_rolls,
+                        winner, margin, loser_eliminated, log)
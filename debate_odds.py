@@ -0,0 +1,68 @@
+"""
+Exact debate odds.
+
+Each die hits on a 5 or 6, so a side's hits are Binomial(dice, 1/3) and the
+margin distribution is the convolution of the two sides' PMFs. No sampling
+needed; PMFs are memoised by dice count so repeated queries are lookups.
+"""
+from functools import lru_cache
+from math import exp, lgamma, log
+from types import MappingProxyType
+
+import profiling
+from debate_engine import DebateOdds, DebateState, dice_pools, is_protestant
+from debaters import debaters
+
+P_HIT = 1 / 3
+
+# Memoised PMFs kept; real debates use a few dozen dice counts at most, but
+# long-running callers (debate_service) should not grow without bound
+HITS_CACHE_SIZE = 1024
+MARGIN_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=HITS_CACHE_SIZE)
+def hits_pmf(dice):
+    """P(hits = k) for k in 0..dice."""
+    # In log space: comb(dice, k) overflows a float past ~1,000 dice
+    log_hit, log_miss = log(P_HIT), log(1 - P_HIT)
+    log_n = lgamma(dice + 1)
+    return tuple(exp(log_n - lgamma(k + 1) - lgamma(dice - k + 1)
+                     + k * log_hit + (dice - k) * log_miss)
+                 for k in range(dice + 1))
+
+
+@lru_cache(maxsize=MARGIN_CACHE_SIZE)
+def margin_pmf(protestant_dice, papal_dice):
+    """
+    {margin: probability} for margin = protestant hits - papal hits. The
+    mapping is read-only: it is shared by every caller through the cache.
+    """
+    protestant = hits_pmf(protestant_dice)
+    papal = hits_pmf(papal_dice)
+    probs = {}
+    for i, p in enumerate(protestant):
+        for j, q in enumerate(papal):
+            probs[i - j] = probs.get(i - j, 0.0) + p * q
+    return MappingProxyType(probs)
+
+
+@profiling.traced("odds.exact_odds")
+def exact_odds(state):
+    """Exact DebateOdds for a DebateState."""
+    protestant_dice, papal_dice, _ = dice_pools(state)
+    return DebateOdds(margin_pmf(protestant_dice, papal_dice),
+                      state.protestant.debate_value, state.papal.debate_value)
+
+
+def all_matchup_odds(protestant_attacking=True, defender_committed=False,
+                     modifiers=None, roster=debaters):
+    """Yield (protestant, papal, DebateOdds) for every pairing in the roster."""
+    protestants = [d for d in roster if is_protestant(d)]
+    papals = [d for d in roster if not is_protestant(d)]
+    for protestant in protestants:
+        for papal in papals:
+            state = DebateState(protestant, papal, protestant_attacking,
+                                defender_committed=defender_committed,
+                                modifiers=modifiers)
+            yield protestant, papal, exact_odds(state)
@@ -0,0 +1,397 @@
+"""
+Local HTTP service for debate resolution, for tools that should not import Qt.
+
+    python debate_service.py                       # http://127.0.0.1:8765
+    python debate_service.py --unix /tmp/his.sock  # HTTP over a Unix socket
+
+Endpoints (JSON in, JSON out; scenarios as in scenarios.py):
+
+    POST /odds      exact odds for one scenario object or a list of them
+    POST /resolve   roll one scenario or a list
+    GET  /health    {"ok": true, ...counters}
+
+A list in gives a list out, in order; a bad scenario (or one whose
+computation fails) gives an {"error": ...} record in its place, as in
+debate_cli.py, without affecting the rest of its batch. For example
+
+    curl -d '{"attacker": "Luther", "defender": "Eck"}' localhost:8765/odds
+
+Requests that arrive together, from any number of connections, are
+coalesced into one batch per event-loop pass (or per --batch-window-ms).
+A batch rolls all of its debates as one NumPy array, and works out exact
+odds once per distinct dice matchup in it. Exact odds are also kept in an
+LRU cache keyed on the normalised scenario, so repeated queries skip the
+work entirely. ServiceClient is a small keep-alive client for scripts.
+"""
+import argparse
+import asyncio
+import http.client
+import json
+import socket
+import sys
+from collections import OrderedDict
+
+import numpy as np
+
+import profiling
+from debate_engine import DebateResult, dice_pools, judge
+from debate_odds import exact_odds
+from rules import DEFAULT_RULES, RulesError, load_rules
+from scenarios import ScenarioError, odds_record, result_record, scenario_state
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Exact-odds results kept in the LRU cache
+DEFAULT_CACHE_SIZE = 100_000
+# Scenarios computed together; a bigger backlog is flushed straight away
+MAX_BATCH = 8_192
+# Largest request body accepted
+MAX_BODY = 16 * 1024 * 1024
+
+MODES = ("odds", "resolve")
+
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+               413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+def scenario_key(state):
+    """The normalised scenario: everything the odds of a debate depend on."""
+    mods = state.modifiers
+    return (state.protestant.name, state.papal.name, state.protestant_attacking,
+            state.defender_committed, mods.flags, mods.protestant_bonus, mods.papal_bonus)
+
+
+def _error_record(error):
+    """The record of a scenario whose computation failed."""
+    return {"error": f"{type(error).__name__}: {error}"}
+
+
+class DebateService:
+    """Coalesces scenario requests into batches and serves them over HTTP."""
+
+    def __init__(self, rules=DEFAULT_RULES, seed=None, cache_size=DEFAULT_CACHE_SIZE,
+                 batch_window=0.0, max_batch=MAX_BATCH):
+        self.rules = rules
+        self.rng = np.random.default_rng(seed)
+        self.cache_size = cache_size
+        self.batch_window = batch_window  # seconds to wait for more requests
+        self.max_batch = max_batch
+        self.odds_cache = OrderedDict()  # scenario_key -> odds_record without "id"
+        self.stats = {"requests": 0, "scenarios": 0, "batches": 0,
+                      "cache_hits": 0, "cache_misses": 0}
+        self._pending = []  # (mode, scenarios, future)
+        self._pending_count = 0
+        self._flush_handle = None
+
+    # -------------------------------------------------------------------------
+    # Batch computation
+    # -------------------------------------------------------------------------
+    def _parse(self, scenario):
+        """(state, None) or (None, error message) for one scenario."""
+        if not isinstance(scenario, dict):
+            return None, "Scenario must be a JSON object"
+        try:
+            return scenario_state(scenario, rules=self.rules), None
+        except (ValueError, TypeError) as e:
+            return None, str(e)
+
+    @profiling.traced("service.compute")
+    def compute(self, mode, scenarios):
+        """Output records for a list of scenario dicts, in order."""
+        parsed = [self._parse(scenario) for scenario in scenarios]
+        states = [state for state, _ in parsed if state is not None]
+        computed = iter(self._odds(states) if mode == "odds" else self._resolve(states))
+
+        records = []
+        for scenario, (state, error) in zip(scenarios, parsed):
+            record = {"error": error} if state is None else next(computed)
+            if isinstance(scenario, dict) and "id" in scenario:
+                record = {"id": scenario["id"], **record}
+            records.append(record)
+        return records
+
+    def _odds(self, states):
+        cache = self.odds_cache
+        records = [None] * len(states)
+        # Cache misses grouped by dice matchup, so each is worked out once
+        misses = {}
+        for i, state in enumerate(states):
+            key = scenario_key(state)
+            record = cache.get(key)
+            if record is not None:
+                cache.move_to_end(key)
+                records[i] = record
+                self.stats["cache_hits"] += 1
+                continue
+            self.stats["cache_misses"] += 1
+            try:
+                protestant_dice, papal_dice, _ = dice_pools(state)
+            except Exception as e:
+                records[i] = _error_record(e)
+                continue
+            group = (protestant_dice, papal_dice,
+                     state.protestant.debate_value, state.papal.debate_value)
+            misses.setdefault(group, []).append((i, key, state))
+
+        for group in misses.values():
+            try:
+                odds = exact_odds(group[0][2])
+            except Exception as e:
+                for i, _, _ in group:
+                    records[i] = _error_record(e)
+                continue
+            for i, key, state in group:
+                record = odds_record(state, odds)
+                records[i] = record
+                cache[key] = record
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return records
+
+    def _resolve(self, states):
+        records = [None] * len(states)
+        rolled = []  # (index, state, protestant dice, papal dice)
+        for i, state in enumerate(states):
+            try:
+                p, q, _ = dice_pools(state)
+            except Exception as e:
+                records[i] = _error_record(e)
+                continue
+            rolled.append((i, state, p, q))
+        if not rolled:
+            return records
+
+        protestant_dice = np.array([p for _, _, p, _ in rolled])
+        papal_dice = np.array([q for _, _, _, q in rolled])
+        # One array of d6 per side for the whole batch; row n uses its first dice
+        protestant_rolls = self.rng.integers(1, 7, size=(len(rolled), protestant_dice.max()),
+                                             dtype=np.int8).tolist()
+        papal_rolls = self.rng.integers(1, 7, size=(len(rolled), papal_dice.max()),
+                                        dtype=np.int8).tolist()
+        profiling.count("service.rolls", int(protestant_dice.sum() + papal_dice.sum()))
+
+        for n, (i, state, p, q) in enumerate(rolled):
+            p_rolls = protestant_rolls[n][:p]
+            q_rolls = papal_rolls[n][:q]
+            try:
+                winner, margin, eliminated = judge(state, sum(r >= 5 for r in p_rolls),
+                                                   sum(r >= 5 for r in q_rolls))
+                result = DebateResult(p, q, p_rolls, q_rolls, winner, margin, eliminated, [])
+                records[i] = result_record(state, result)
+            except Exception as e:
+                records[i] = _error_record(e)
+        return records
+
+    # -------------------------------------------------------------------------
+    # Coalescing
+    # -------------------------------------------------------------------------
+    async def submit(self, mode, scenarios):
+        """Queue scenarios for the next batch and wait for their records."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((mode, scenarios, future))
+        self._pending_count += len(scenarios)
+        if self._pending_count >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            if self.batch_window > 0:
+                self._flush_handle = loop.call_later(self.batch_window, self._flush)
+            else:
+                self._flush_handle = loop.call_soon(self._flush)
+        return await future
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending, self._pending_count = self._pending, [], 0
+        for mode in MODES:
+            requests = [(scenarios, future) for m, scenarios, future in pending if m == mode]
+            if not requests:
+                continue
+            self.stats["batches"] += 1
+            try:
+                records = self.compute(mode, [s for scenarios, _ in requests for s in scenarios])
+            except Exception as e:
+                for _, future in requests:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            start = 0
+            for scenarios, future in requests:
+                if not future.done():
+                    future.set_result(records[start:start + len(scenarios)])
+                start += len(scenarios)
+
+    # -------------------------------------------------------------------------
+    # HTTP
+    # -------------------------------------------------------------------------
+    async def dispatch(self, method, path, body):
+        """(status, JSON-ready payload) for one request."""
+        path = path.split("?", 1)[0].rstrip("/")
+        if path == "/health":
+            if method != "GET":
+                return 405, {"error": "Use GET"}
+            return 200, {"ok": True, "cache_size": len(self.odds_cache), **self.stats}
+        mode = path[1:]
+        if mode not in MODES:
+            return 404, {"error": f"Unknown path: {path!r}"}
+        if method != "POST":
+            return 405, {"error": "Use POST"}
+        try:
+            payload = json.loads(body)
+        except ValueError as e:
+            return 400, {"error": f"Bad JSON: {e}"}
+
+        self.stats["requests"] += 1
+        single = not isinstance(payload, list)
+        scenarios = [payload] if single else payload
+        self.stats["scenarios"] += len(scenarios)
+        records = await self.submit(mode, scenarios) if scenarios else []
+        return 200, records[0] if single else records
+
+    async def handle_connection(self, reader, writer):
+        """Serve HTTP/1.1 requests on one connection, keeping it alive between them."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                try:
+                    method, path, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self._respond(writer, 400, {"error": "Bad request line"}, False)
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = (headers.get("connection", "").lower() != "close"
+                              and version == "HTTP/1.1")
+                try:
+                    length = int(headers.get("content-length", 0))
+                except ValueError:
+                    length = -1
+                if not 0 <= length <= MAX_BODY:
+                    await self._respond(writer, 413 if length > MAX_BODY else 400,
+                                        {"error": "Bad or oversized Content-Length"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                try:
+                    status, payload = await self.dispatch(method, path, body)
+                except Exception as e:
+                    status, payload = 500, {"error": f"{type(e).__name__}: {e}"}
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, status, payload, keep_alive):
+        body = json.dumps(payload).encode()
+        writer.write(
+            f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + body)
+        await writer.drain()
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None):
+        """Start listening and return the asyncio Server."""
+        if unix_path:
+            return await asyncio.start_unix_server(self.handle_connection, path=unix_path)
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+
+class ServiceClient:
+    """Blocking client over one keep-alive connection."""
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None, timeout=30):
+        if unix_path:
+            self.connection = _UnixHTTPConnection(unix_path, timeout=timeout)
+        else:
+            self.connection = http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def request(self, method, path, payload=None):
+        body = None if payload is None else json.dumps(payload)
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        self.connection.request(method, path, body=body, headers=headers)
+        response = self.connection.getresponse()
+        data = json.loads(response.read())
+        if response.status != 200:
+            raise ScenarioError(data.get("error", f"HTTP {response.status}"))
+        return data
+
+    def odds(self, scenarios):
+        """Exact odds record(s) for a scenario dict or a list of them."""
+        return self.request("POST", "/odds", scenarios)
+
+    def resolve(self, scenarios):
+        """Rolled result record(s) for a scenario dict or a list of them."""
+        return self.request("POST", "/resolve", scenarios)
+
+    def health(self):
+        return self.request("GET", "/health")
+
+    def close(self):
+        self.connection.close()
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path, timeout=30):
+        super().__init__("localhost", timeout=timeout)
+        self.unix_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.unix_path)
+
+
+async def serve(service, host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None):
+    server = await service.start(host, port, unix_path)
+    where = unix_path or "http://{}:{}".format(*server.sockets[0].getsockname()[:2])
+    print(f"Serving debate resolution on {where}", file=sys.stderr)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve debate odds and resolution over HTTP.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", default=None, metavar="PATH",
+                        help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--rules", default=None,
+                        help="event modifier rules file (default: modifiers.json)")
+    parser.add_argument("--seed", type=int, default=None, help="seed for reproducible rolls")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE,
+                        help="exact-odds results kept in the LRU cache")
+    parser.add_argument("--batch-window-ms", type=float, default=0.0,
+                        help="wait this long for more requests before computing a batch")
+    args = parser.parse_args(argv)
+
+    try:
+        rules = load_rules(args.rules) if args.rules else DEFAULT_RULES
+    except (OSError, RulesError) as e:
+        parser.error(str(e))
+
+    service = DebateService(rules, seed=args.seed, cache_size=args.cache_size,
+                            batch_window=args.batch_window_ms / 1000)
+    try:
+        asyncio.run(serve(service, args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,626 @@
+"""
+The Qt window. Only imported when the GUI is launched (see debate_resolver.main).
+"""
+import argparse
+import sys
+import random
+from PyQt6.QtWidgets import (
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QLabel, QCheckBox, QSpinBox, QPushButton, QComboBox,
+    QTableView, QAbstractItemView, QHeaderView, QSizePolicy, QProgressBar, QFileDialog
+)
+from PyQt6.QtCore import Qt, QTimer
+
+import profiling
+from advisor import rank_attackers
+from campaign import CampaignSettings
+from debate_engine import DebateModifiers, DebateState
+from debate_engine import resolve_debate as resolve_debate_state
+from debate_montecarlo import iter_adaptive_estimates
+from debater_table_model import (AVAILABLE_COLUMN, COMMITTED_COLUMN, DebaterFilterProxy,
+                                 DebaterTableModel)
+from debaters import CATHOLIC, ENGLISH, FRENCH, GERMAN, registry
+from game_store import GameState, GameStore
+from gui_tasks import TaskRunner
+from log_view import LogView
+from matchup_table import build_matchup_table, load_matchup_table
+from parallel import parallel_run_campaigns
+from roster import RosterArrays
+from rules import DEFAULT_RULES, load_rules
+from scenarios import MAX_BONUS_DICE
+
+# "Estimate odds" rolls until the probabilities are known to +/- this much
+# (95% confidence), but never more than ODDS_TRIALS debates
+ODDS_PRECISION = 0.002
+ODDS_TRIALS = 1_000_000
+# Number of games behind the "Simulate campaigns" button
+CAMPAIGN_COUNT = 2_000
+
+# Lines kept in the output log before the oldest are dropped
+LOG_MAX_LINES = 10_000
+
+GAME_FILE_FILTER = "Here I Stand game journal (*.jsonl);;All files (*)"
+
+class DebateResolverWindow(QMainWindow):
+    def __init__(self, rules=None):
+        super().__init__()
+        # Event modifiers; one checkbox is generated per rule
+        self.rules = rules if rules is not None else DEFAULT_RULES
+        self.setWindowTitle("Here I Stand - Auto-Resolve Debates")
+        self.resize(900, 600)
+
+        # Top-level container
+        main_widget = QWidget()
+        self.setCentralWidget(main_widget)
+        main_layout = QVBoxLayout()
+        main_widget.setLayout(main_layout)
+
+        # ---------------------------------------
+        # 1) Language Zone Selection
+        # ---------------------------------------
+        self.language_combo = QComboBox()
+        self.language_combo.addItems(["All", GERMAN, ENGLISH, CATHOLIC, FRENCH])
+        self.language_combo.currentIndexChanged.connect(self.filter_debaters_table)
+
+        # If you want to consider the game "turn" in filtering:
+        self.current_turn_spin = QSpinBox()
+        self.current_turn_spin.setRange(0, 50)
+        self.current_turn_spin.setValue(1)
+        self.current_turn_spin.valueChanged.connect(self.filter_debaters_table)
+
+        # Layout for top controls
+        top_controls_layout = QHBoxLayout()
+        top_controls_layout.addWidget(QLabel("Select Language Zone:"))
+        top_controls_layout.addWidget(self.language_combo)
+        top_controls_layout.addWidget(QLabel("Current Turn:"))
+        top_controls_layout.addWidget(self.current_turn_spin)
+        main_layout.addLayout(top_controls_layout)
+
+        self.reset_committed_btn = QPushButton("Reset All Committed")
+        self.reset_committed_btn.clicked.connect(self.reset_all_committed)
+        self.new_game_btn = QPushButton("New Game File...")
+        self.new_game_btn.clicked.connect(self.new_game_file)
+        self.open_game_btn = QPushButton("Open Game...")
+        self.open_game_btn.clicked.connect(self.open_game_file)
+
+        game_layout = QHBoxLayout()
+        game_layout.addWidget(self.reset_committed_btn, stretch=1)
+        game_layout.addWidget(self.new_game_btn)
+        game_layout.addWidget(self.open_game_btn)
+        main_layout.addLayout(game_layout)
+
+
+        # ---------------------------------------
+        # 2) Debaters Table
+        # ---------------------------------------
+        self.debaters_table = QTableView()
+        self.debaters_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.debaters_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.debaters_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        # Set table to expand
+        self.debaters_table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        main_layout.addWidget(self.debaters_table, stretch=1)
+
+        # Available/committed state lives in the roster arrays; the table
+        # model reads it from there
+        self.roster = RosterArrays(registry)
+        self._advice_pending = False
+
+        # Populate once, then filter in place
+        self.populate_debaters_table()
+        self.filter_debaters_table()
+
+        # ---------------------------------------
+        # 3) Random Selection & Checkboxes (Events)
+        # ---------------------------------------
+        self.select_attacker_protestant = QPushButton("Select Protestant as Attacker")
+        self.select_attacker_papal = QPushButton("Select Papal as Attacker")
+
+        self.select_attacker_protestant.clicked.connect(lambda: self.select_attacker(True))
+        self.select_attacker_papal.clicked.connect(lambda: self.select_attacker(False))
+
+        random_select_layout = QHBoxLayout()
+        random_select_layout.addWidget(self.select_attacker_protestant)
+        random_select_layout.addWidget(self.select_attacker_papal)
+        main_layout.addLayout(random_select_layout)
+
+        # Event checkboxes, keyed by rule id
+        self.event_checkboxes = {}
+        event_layout = QHBoxLayout()
+        for rule in self.rules:
+            cb = QCheckBox(rule.label)
+            self.event_checkboxes[rule.id] = cb
+            event_layout.addWidget(cb)
+
+        main_layout.addLayout(event_layout)
+
+        # Re-run an odds estimate that is on screen when the events change
+        for cb in self.event_checkboxes.values():
+            cb.toggled.connect(self.refresh_odds)
+            cb.toggled.connect(self.record_events)
+
+        # ---------------------------------------
+        # 4) Spin Boxes for Extra Dice
+        # ---------------------------------------
+        spin_layout = QHBoxLayout()
+        self.protestant_bonus_spin = QSpinBox()
+        self.papal_bonus_spin = QSpinBox()
+        self.protestant_bonus_spin.setRange(0, MAX_BONUS_DICE)
+        self.papal_bonus_spin.setRange(0, MAX_BONUS_DICE)
+        spin_layout.addWidget(QLabel("Protestant Bonus Dice"))
+        spin_layout.addWidget(self.protestant_bonus_spin)
+        spin_layout.addWidget(QLabel("Papal Bonus Dice"))
+        spin_layout.addWidget(self.papal_bonus_spin)
+        main_layout.addLayout(spin_layout)
+        self.protestant_bonus_spin.valueChanged.connect(self.refresh_odds)
+        self.papal_bonus_spin.valueChanged.connect(self.refresh_odds)
+
+        # ---------------------------------------
+        # 5) Resolve Button & Output
+        # ---------------------------------------
+        self.resolve_button = QPushButton("Resolve Debate")
+        self.resolve_button.clicked.connect(self.resolve_debate)
+        self.estimate_odds_button = QPushButton("Estimate odds")
+        self.estimate_odds_button.clicked.connect(self.estimate_odds)
+
+        self.simulate_campaigns_button = QPushButton("Simulate campaigns")
+        self.simulate_campaigns_button.clicked.connect(self.simulate_campaigns)
+
+        resolve_layout = QHBoxLayout()
+        resolve_layout.addWidget(self.resolve_button)
+        resolve_layout.addWidget(self.estimate_odds_button)
+        resolve_layout.addWidget(self.simulate_campaigns_button)
+        main_layout.addLayout(resolve_layout)
+
+        # Live results from background tasks
+        self.odds_label = QLabel()
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        status_layout = QHBoxLayout()
+        status_layout.addWidget(self.odds_label, stretch=1)
+        status_layout.addWidget(self.progress_bar)
+        main_layout.addLayout(status_layout)
+
+        # Bounded, virtualised log; appends are batched into one update per pass
+        self.output_box = LogView(LOG_MAX_LINES)
+        # Make output box smaller relative to table
+        self.output_box.setMaximumHeight(150)
+        main_layout.addWidget(self.output_box)
+
+        self.export_log_btn = QPushButton("Export Log...")
+        self.export_log_btn.clicked.connect(self.export_log)
+        main_layout.addWidget(self.export_log_btn)
+
+        # Keep track of the currently chosen debaters
+        self.selected_protestant_debater = None
+        self.selected_papal_debater = None
+
+        # Add a new instance variable to track who is attacking
+        self.is_protestant_attacking = None
+
+        # Background work, and the matchup whose odds are on screen
+        self.tasks = TaskRunner(self)
+        self.odds_matchup = None
+
+        # Precomputed odds for the Advice column, loaded off the UI thread;
+        # until it arrives (or with bonus dice) the advisor uses exact odds
+        self.matchup_table = None
+        self.tasks.submit("matchup_table", matchup_table_task, self.rules,
+                          on_finished=self.matchup_table_loaded,
+                          on_failed=self.task_failed)
+
+        # Journal of the current game, once saved or opened (see game_store)
+        self.game_store = None
+        self.current_turn_spin.valueChanged.connect(self.record_turn)
+        self.debaters_model.flag_changed.connect(self.record_flag)
+
+    # -------------------------------------------------------------------------
+    # Populate the table with all debaters
+    # -------------------------------------------------------------------------
+    def populate_debaters_table(self):
+        """
+        Attach the roster model to the table view.
+        All debaters are in the model; the proxy does the filtering.
+        """
+        self.debaters_model = DebaterTableModel(self.roster, self)
+        self.debaters_proxy = DebaterFilterProxy(self.roster, self)
+        self.debaters_proxy.setSourceModel(self.debaters_model)
+        self.debaters_table.setModel(self.debaters_proxy)
+        self.debaters_model.dataChanged.connect(self._flags_changed)
+        self.debaters_table.setSortingEnabled(True)
+        self.debaters_table.sortByColumn(-1, Qt.SortOrder.AscendingOrder)  # keep roster order
+        self.debaters_table.resizeRowsToContents()
+
+    # -------------------------------------------------------------------------
+    # Filter the table based on language zone and turn
+    # -------------------------------------------------------------------------
+    def filter_debaters_table(self):
+        # Papal debaters are always shown, otherwise check zone and turn
+        with profiling.span("ui.filter"):
+            self.debaters_proxy.set_filter(
+                self.language_combo.currentText(), self.current_turn_spin.value())
+            self.request_advice_update()
+
+    def request_advice_update(self):
+        """Queue an Advice refresh; several changes in one event collapse into one"""
+        if not self._advice_pending:
+            self._advice_pending = True
+            QTimer.singleShot(0, self.update_advice)
+
+    @profiling.traced("ui.advice")
+    def update_advice(self):
+        """Re-rank the callable attackers of both sides for the Advice column"""
+        self._advice_pending = False
+        modifiers = self.current_modifiers()
+        self.debaters_model.set_advice([
+            rank_attackers(self.roster, protestant_attacking, self.visible_rows, modifiers,
+                           table=self.matchup_table)
+            for protestant_attacking in (True, False)
+        ])
+
+    def matchup_table_loaded(self, table):
+        self.matchup_table = table
+        self.request_advice_update()
+
+    def _flags_changed(self, top_left, bottom_right, roles):
+        # Availability/commitment changes alter who can attack or defend
+        if top_left.column() <= COMMITTED_COLUMN and bottom_right.column() >= AVAILABLE_COLUMN:
+            self.request_advice_update()
+
+    @property
+    def visible_rows(self):
+        """Boolean mask of the roster rows the table currently shows"""
+        return self.debaters_proxy.visible_rows
+
+    # -------------------------------------------------------------------------
+    # Randomly pick a debater from the filtered rows
+    # -------------------------------------------------------------------------
+    @profiling.traced("ui.select_defender")
+    def select_random_debater(self, is_protestant):
+        """
+        Select a random debater based on type.
+        Args:
+            is_protestant (bool): True to select Protestant, False to select Papal
+        """
+        # Visible, available debaters of the requested type
+        valid_rows = self.roster.candidates(is_protestant, self.visible_rows).tolist()
+
+        if not valid_rows:
+            self.output_box.append(f"No valid {'Protestant' if is_protestant else 'Papal'} debater found!")
+            return
+
+        chosen_row = random.choice(valid_rows)
+        chosen_debater = registry.at_row(chosen_row)
+
+        if is_protestant:
+            self.selected_protestant_debater = chosen_debater
+        else:
+            self.selected_papal_debater = chosen_debater
+
+        self.output_box.append(f"Selected {'Protestant' if is_protestant else 'Papal'} Debater: {chosen_debater.name} ({chosen_debater.debate_value})")
+
+    @profiling.traced("ui.select_attacker")
+    def select_attacker(self, is_protestant_attacker):
+        """
+        Select an attacker and automatically select a defender of the opposite side.
+        Args:
+            is_protestant_attacker (bool): True if Protestant is attacking, False if Papal is attacking
+        """
+        # Store who is attacking
+        self.is_protestant_attacking = is_protestant_attacker
+        
+        # First select the attacker (must be uncommitted)
+        valid_rows = self.roster.candidates(
+            is_protestant_attacker, self.visible_rows, uncommitted=True).tolist()
+
+        if not valid_rows:
+            self.output_box.append(f"No valid uncommitted {'Protestant' if is_protestant_attacker else 'Papal'} attacker found!")
+            return
+
+        # Select attacker
+        chosen_row = random.choice(valid_rows)
+        chosen_debater = registry.at_row(chosen_row)
+
+        # Store the selected debater and note they are attacker
+        if is_protestant_attacker:
+            self.selected_protestant_debater = chosen_debater
+            self.output_box.append(f"Selected Protestant Attacker: {chosen_debater.name} ({chosen_debater.debate_value})")
+            # Now select a Papal defender
+            self.select_random_debater(False)
+        else:
+            self.selected_papal_debater = chosen_debater
+            self.output_box.append(f"Selected Papal Attacker: {chosen_debater.name} ({chosen_debater.debate_value})")
+            # Now select a Protestant defender
+            self.select_random_debater(True)
+
+    # -------------------------------------------------------------------------
+    # Resolve the debate with the chosen Protestant/Papal debaters
+    # -------------------------------------------------------------------------
+    def resolve_debate(self):
+        with profiling.span("ui.resolve"):
+            self._resolve_debate()
+
+    def _resolve_debate(self):
+        self.output_box.append("=== Resolving Debate ===")
+
+        if not self.selected_protestant_debater or not self.selected_papal_debater:
+            self.output_box.append("Please select BOTH a Protestant and Papal debater first!")
+            return
+
+        if self.is_protestant_attacking is None:
+            self.output_box.append("Please select an attacker first!")
+            return
+
+        state = self.current_debate_state()
+        result = resolve_debate_state(state)
+        if self.game_store:
+            self.game_store.record_debate(state, result)
+        for line in result.log:
+            self.output_box.append(line)
+
+        # Make the losing debater unavailable if burned / disgraced
+        if result.papal_disgraced:
+            self.set_debater_availability(self.selected_papal_debater.name, False)
+        elif result.protestant_burned:
+            self.set_debater_availability(self.selected_protestant_debater.name, False)
+
+        # --------------------------------------------------------
+        # **Only clear the spin boxes**. We do NOT clear the checkboxes.
+        # --------------------------------------------------------
+        self.protestant_bonus_spin.setValue(0)
+        self.papal_bonus_spin.setValue(0)
+
+        # After determining the winner, mark both debaters as committed
+        for debater in (self.selected_protestant_debater, self.selected_papal_debater):
+            self.set_debater_committed(debater.name, True)
+
+        self.output_box.append("--- Debate Resolution Complete ---\n")
+
+    def estimate_odds(self):
+        """Simulate the selected matchup in the background and report the odds"""
+        self.output_box.append("=== Estimating Odds ===")
+
+        if not self.selected_protestant_debater or not self.selected_papal_debater:
+            self.output_box.append("Please select BOTH a Protestant and Papal debater first!")
+            return
+
+        if self.is_protestant_attacking is None:
+            self.output_box.append("Please select an attacker first!")
+            return
+
+        self.odds_matchup = self.current_matchup()
+        self.start_odds_task(debounce=False)
+
+    def refresh_odds(self):
+        """Recompute the on-screen odds after an event or bonus change, coalescing bursts"""
+        self.request_advice_update()
+        if self.odds_matchup is not None and self.odds_matchup == self.current_matchup():
+            self.start_odds_task(debounce=True)
+
+    def current_matchup(self):
+        return (self.selected_protestant_debater, self.selected_papal_debater,
+                self.is_protestant_attacking)
+
+    def start_odds_task(self, debounce):
+        self.tasks.submit(
+            "odds", odds_task, self.current_debate_state(), ODDS_TRIALS,
+            on_partial=self.show_partial_odds,
+            on_progress=self.show_progress,
+            on_finished=self.odds_finished,
+            on_failed=self.task_failed,
+            debounce=debounce,
+        )
+
+    @profiling.traced("ui.odds_label")
+    def show_partial_odds(self, odds):
+        self.odds_label.setText(
+            f"{odds.trials:,} trials: Protestant {odds.p_protestant_win:.1%} / "
+            f"tie {odds.p_tie:.1%} / Papal {odds.p_papal_win:.1%}, "
+            f"disgrace {odds.p_papal_disgraced:.1%}, burn {odds.p_protestant_burned:.1%} "
+            f"(±{odds.precision:.1%})"
+        )
+
+    def odds_finished(self, odds):
+        self.progress_bar.setVisible(False)
+        self.show_partial_odds(odds)
+        for line in odds.summary():
+            self.output_box.append(line)
+        self.output_box.append("")
+
+    def simulate_campaigns(self):
+        """Play many whole-game campaigns in the background from the current settings"""
+        if self.tasks.is_running("campaigns"):
+            self.tasks.cancel("campaigns")
+            self.progress_bar.setVisible(False)
+            self.output_box.append("Campaign simulation cancelled.")
+            return
+
+        self.output_box.append(f"=== Simulating {CAMPAIGN_COUNT:,} Campaigns ===")
+        # Optional debaters the player has marked available are brought in
+        optional_debaters = [registry.at_row(row).name for row in
+                             (self.roster.optional & self.roster.available).nonzero()[0]]
+        settings = CampaignSettings(
+            turns=max(self.current_turn_spin.value(), 1),
+            optional_debaters=optional_debaters,
+            modifiers=self.current_modifiers(),
+        )
+        self.tasks.submit(
+            "campaigns", campaign_task, settings, CAMPAIGN_COUNT,
+            on_progress=self.show_progress,
+            on_finished=self.campaigns_finished,
+            on_failed=self.task_failed,
+        )
+
+    def campaigns_finished(self, summary):
+        self.progress_bar.setVisible(False)
+        for line in summary.summary():
+            self.output_box.append(line)
+        self.output_box.append("")
+
+    def show_progress(self, done, total):
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(done)
+
+    def task_failed(self, message):
+        self.progress_bar.setVisible(False)
+        self.output_box.append(f"Background task failed: {message}")
+
+    def closeEvent(self, event):
+        self.tasks.shutdown()
+        if self.game_store:
+            self.game_store.close()
+        super().closeEvent(event)
+
+    def export_log(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Log", "", "Text files (*.txt);;All files (*)")
+        if path:
+            self.output_box.export(path)
+
+    # -------------------------------------------------------------------------
+    # Saved games
+    # -------------------------------------------------------------------------
+    def current_game(self):
+        return GameState(self.roster, self.current_turn_spin.value(),
+                         self.current_modifiers().events, rules=self.rules)
+
+    def new_game_file(self):
+        """Start journalling the current state to a new file"""
+        path, _ = QFileDialog.getSaveFileName(self, "New Game File", "", GAME_FILE_FILTER)
+        if not path:
+            return
+        if self.game_store:
+            self.game_store.close()
+        self.game_store = GameStore.create(path, self.current_game())
+        self.output_box.append(f"Saving game to {path}")
+
+    def open_game_file(self):
+        """Load a journal and keep appending to it"""
+        path, _ = QFileDialog.getOpenFileName(self, "Open Game", "", GAME_FILE_FILTER)
+        if not path:
+            return
+        try:
+            store, game = GameStore.open(path, rules=self.rules)
+        except (OSError, ValueError, KeyError) as e:
+            self.output_box.append(f"Could not open {path}: {e}")
+            return
+        if self.game_store:
+            self.game_store.close()
+        # Apply the loaded state before binding the store so it isn't re-journalled
+        self.game_store = None
+        self.load_game_state(game)
+        self.game_store = store
+        self.output_box.append(f"Loaded {path}: turn {game.turn}, {len(game.history)} debate(s).")
+
+    def load_game_state(self, game):
+        self.roster.available[:] = game.roster.available
+        self.roster.committed[:] = game.roster.committed
+        self.debaters_model.refresh_column(AVAILABLE_COLUMN)
+        self.debaters_model.refresh_column(COMMITTED_COLUMN)
+        self.current_turn_spin.setValue(game.turn)
+        for rule in self.rules:
+            self.event_checkboxes[rule.id].setChecked(rule.id in game.events)
+        self.request_advice_update()
+
+    def record_flag(self, row, column, value):
+        if self.game_store:
+            name = registry.at_row(row).name
+            if column == AVAILABLE_COLUMN:
+                self.game_store.record_available(name, value)
+            elif column == COMMITTED_COLUMN:
+                self.game_store.record_committed(name, value)
+
+    def record_turn(self, turn):
+        if self.game_store:
+            self.game_store.record_turn(turn)
+
+    def record_events(self):
+        if self.game_store:
+            self.game_store.record_events(self.current_modifiers().events)
+
+    def current_debate_state(self):
+        """Build a DebateState from the selected debaters and the event widgets"""
+        defender = (self.selected_papal_debater if self.is_protestant_attacking
+                    else self.selected_protestant_debater)
+        return DebateState(
+            self.selected_protestant_debater,
+            self.selected_papal_debater,
+            self.is_protestant_attacking,
+            defender_committed=self.is_debater_committed(defender),
+            modifiers=self.current_modifiers(),
+        )
+
+    def current_modifiers(self):
+        """Read the event checkboxes and bonus dice spin boxes"""
+        return DebateModifiers(
+            protestant_bonus=self.protestant_bonus_spin.value(),
+            papal_bonus=self.papal_bonus_spin.value(),
+            rules=self.rules,
+            **{rule_id: cb.isChecked() for rule_id, cb in self.event_checkboxes.items()},
+        )
+
+    def is_debater_committed(self, debater):
+        """Look up a debater's committed flag"""
+        row = registry.row_of(debater.name)
+        return row is not None and bool(self.roster.committed[row])
+
+    def reset_all_committed(self):
+        """Reset all committed flags to False"""
+        self.roster.reset_committed()
+        self.debaters_model.refresh_column(COMMITTED_COLUMN)
+        if self.game_store:
+            self.game_store.record_reset_committed()
+        self.output_box.append("Reset all debaters' committed status.")
+
+    def set_debater_availability(self, debater_name, available):
+        """Set a debater's availability based on their name"""
+        row = registry.row_of(debater_name)
+        if row is not None:
+            self.debaters_model.set_flag(row, AVAILABLE_COLUMN, available)
+
+    def set_debater_committed(self, debater_name, committed):
+        """Set a debater's committed flag based on their name"""
+        row = registry.row_of(debater_name)
+        if row is not None:
+            self.debaters_model.set_flag(row, COMMITTED_COLUMN, committed)
+
+# -----------------------------------------------------------------------------
+# Background task bodies (run on the thread pool, see gui_tasks)
+# -----------------------------------------------------------------------------
+def odds_task(task, state, trials):
+    odds = None
+    for odds in iter_adaptive_estimates(state, ODDS_PRECISION, max_trials=trials):
+        if task.cancelled:
+            return None
+        task.partial(odds)
+        task.progress(odds.trials, trials)
+    return odds
+
+
+def matchup_table_task(task, rules):
+    try:
+        return load_matchup_table(rules=rules)
+    except OSError:
+        # No writable cache directory: keep the table in memory for this session
+        return build_matchup_table(rules=rules)
+
+
+def campaign_task(task, settings, n):
+    return parallel_run_campaigns(n, settings, progress=task.progress,
+                                  cancel=task.cancel_event)
+
+
+def run_gui(argv=None):
+    """Create the QApplication and main window and run the event loop"""
+    argv = sys.argv if argv is None else argv
+    parser = argparse.ArgumentParser(description="Here I Stand debate autoresolver.")
+    parser.add_argument("--rules", default=None,
+                        help="event modifier rules file (default: modifiers.json)")
+    args, qt_args = parser.parse_known_args(argv[1:])
+    rules = load_rules(args.rules) if args.rules else None
+
+    app = QApplication([argv[0], *qt_args])
+    window = DebateResolverWindow(rules)
+    window.show()
+    return app.exec()
+
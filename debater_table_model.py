@@ -0,0 +1,147 @@
+"""
+Qt model/view classes for the debaters table.
+
+DebaterTableModel reads straight from a RosterArrays, with Available and
+Committed as checkable columns, so there is no widget per cell. The proxy
+filters on the roster's zone/turn mask rather than re-parsing cell text.
+"""
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, QSortFilterProxyModel, Qt, pyqtSignal
+
+import profiling
+from roster import ALL_ZONES
+
+NAME_COLUMN = 0
+LANGUAGE_COLUMN = 1
+TURN_COLUMN = 2
+VALUE_COLUMN = 3
+AVAILABLE_COLUMN = 4
+COMMITTED_COLUMN = 5
+ADVICE_COLUMN = 6
+HEADERS = ["Name", "Language", "Turn", "Value", "Available", "Committed", "Advice"]
+
+# Raw (unformatted) values for sorting
+SORT_ROLE = Qt.ItemDataRole.UserRole
+
+
+class DebaterTableModel(QAbstractTableModel):
+    # (row, column, value) whenever one Available/Committed flag is set
+    flag_changed = pyqtSignal(int, int, bool)
+
+    def __init__(self, roster, parent=None):
+        super().__init__(parent)
+        self.roster = roster
+        self._flag_arrays = {
+            AVAILABLE_COLUMN: roster.available,
+            COMMITTED_COLUMN: roster.committed,
+        }
+        self._advice = {}  # row -> advisor.Advice
+        self._advice_rank = {}  # row -> 1-based rank within its side
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.roster)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+
+        if column in self._flag_arrays:
+            checked = bool(self._flag_arrays[column][row])
+            if role == Qt.ItemDataRole.CheckStateRole:
+                return Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+            if role == SORT_ROLE:
+                return int(checked)
+            return None
+
+        if role not in (Qt.ItemDataRole.DisplayRole, SORT_ROLE):
+            return None
+        if column == ADVICE_COLUMN:
+            advice = self._advice.get(row)
+            if advice is None:
+                return None
+            if role == SORT_ROLE:
+                return advice.score
+            return f"#{self._advice_rank[row]}  {advice.score:+.2f}"
+
+        debater = self.roster.registry.at_row(row)
+        if column == NAME_COLUMN:
+            return debater.name
+        if column == LANGUAGE_COLUMN:
+            return debater.language_zone
+        if column == TURN_COLUMN:
+            return debater.turn if role == SORT_ROLE else str(debater.turn)
+        if column == VALUE_COLUMN:
+            return debater.debate_value if role == SORT_ROLE else str(debater.debate_value)
+        return None
+
+    def flags(self, index):
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() in self._flag_arrays:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.CheckStateRole or index.column() not in self._flag_arrays:
+            return False
+        checked = Qt.CheckState(value) == Qt.CheckState.Checked
+        self.set_flag(index.row(), index.column(), checked)
+        return True
+
+    def set_flag(self, row, column, value):
+        """Set the Available/Committed flag of one row and refresh that cell."""
+        profiling.count("ui.cell_updates")
+        self._flag_arrays[column][row] = value
+        cell = self.index(row, column)
+        self.dataChanged.emit(cell, cell, [Qt.ItemDataRole.CheckStateRole])
+        self.flag_changed.emit(row, column, bool(value))
+
+    def set_advice(self, rankings):
+        """Show advisor rankings (lists of Advice, best first) in the Advice column."""
+        self._advice = {}
+        self._advice_rank = {}
+        for ranking in rankings:
+            for rank, advice in enumerate(ranking, start=1):
+                self._advice[advice.row] = advice
+                self._advice_rank[advice.row] = rank
+        self.refresh_column(ADVICE_COLUMN, Qt.ItemDataRole.DisplayRole)
+
+    def refresh_column(self, column, role=Qt.ItemDataRole.CheckStateRole):
+        """Tell views a whole column changed, e.g. after a bulk reset."""
+        profiling.count("ui.column_refreshes")
+        self.dataChanged.emit(self.index(0, column), self.index(len(self.roster) - 1, column),
+                              [role])
+
+
+class DebaterFilterProxy(QSortFilterProxyModel):
+    """Shows the rows matching a language zone and turn (papal debaters always)."""
+
+    def __init__(self, roster, parent=None):
+        super().__init__(parent)
+        self.roster = roster
+        self.visible_rows = roster.visible_mask()
+        self._visible = self.visible_rows.tolist()
+        self.setSortRole(SORT_ROLE)
+
+    @profiling.traced("ui.proxy_filter")
+    def set_filter(self, zone=ALL_ZONES, turn=None):
+        mask = self.roster.visible_mask(zone, turn)
+        self.visible_rows = mask
+        visible = mask.tolist()
+        # Scrubbing the turn spinner mostly lands on turns where nothing
+        # new comes in; skip the refilter when the visible set is unchanged
+        if visible == self._visible:
+            return
+        self._visible = visible
+        profiling.count("ui.proxy_invalidations")
+        self.invalidateRowsFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self._visible[source_row]
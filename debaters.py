@@ -1,11 +1,12 @@
 class Debater:
-    def __init__(self, name, turn, debate_value, language_zone, optional=False, committed=False):
+    __slots__ = ("name", "turn", "debate_value", "language_zone", "optional")
+
+    def __init__(self, name, turn, debate_value, language_zone, optional=False):
         self.name = name
         self.turn = turn
         self.debate_value = debate_value
         self.language_zone = language_zone
         self.optional = optional
-        self.committed = committed
 
 # Define language zones
 GERMAN = "German"
@@ -13,6 +14,9 @@ ENGLISH = "English"
 CATHOLIC = "Catholic"
 FRENCH = "French"
 
+# Compact integer codes for the zones, used by roster.RosterArrays
+ZONE_CODES = {GERMAN: 0, ENGLISH: 1, CATHOLIC: 2, FRENCH: 3}
+
 # List of all debaters
 debaters = [
     # German Protestant debaters
@@ -53,11 +57,68 @@ debaters = [
     Debater("Farel", 4, 2, FRENCH)
 ]
 
+class DebaterRegistry:
+    """
+    Index over a list of debaters: O(1) lookup by name, per-zone and per-turn
+    lists, and a stable row <-> debater mapping (row i is debaters[i]).
+    """
+    def __init__(self, debaters):
+        self.debaters = list(debaters)
+        self._by_name = {}
+        self._row_by_name = {}
+        self._by_zone = {}
+        self._by_turn = {}
+        for row, d in enumerate(self.debaters):
+            if d.name in self._by_name:
+                raise ValueError(f"Duplicate debater name: {d.name}")
+            self._by_name[d.name] = d
+            self._row_by_name[d.name] = row
+            self._by_zone.setdefault(d.language_zone, []).append(d)
+            self._by_turn.setdefault(d.turn, []).append(d)
+        self.protestants = [d for d in self.debaters if d.language_zone != CATHOLIC]
+        self.papals = [d for d in self.debaters if d.language_zone == CATHOLIC]
+
+    def __len__(self):
+        return len(self.debaters)
+
+    def __iter__(self):
+        return iter(self.debaters)
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def get(self, name, default=None):
+        return self._by_name.get(name, default)
+
+    def __getitem__(self, name):
+        return self._by_name[name]
+
+    def row_of(self, name):
+        """Table row of a debater, or None if unknown."""
+        return self._row_by_name.get(name)
+
+    def at_row(self, row):
+        return self.debaters[row]
+
+    def in_zone(self, zone):
+        return self._by_zone.get(zone, [])
+
+    def entering_on(self, turn):
+        """Debaters whose card comes in on exactly this turn."""
+        return self._by_turn.get(turn, [])
+
+    def in_play_by(self, turn):
+        """Debaters whose turn has arrived by the given turn."""
+        return [d for t in sorted(self._by_turn) if t <= turn for d in self._by_turn[t]]
+
+
+registry = DebaterRegistry(debaters)
+
 # Example usage:
 if __name__ == "__main__":
     # Print all Catholic debaters
     print("Catholic Debaters:")
-    for debater in [d for d in debaters if d.language_zone == CATHOLIC]:
+    for debater in registry.in_zone(CATHOLIC):
         print(f"{debater.name}: Value {debater.debate_value}, Turn {debater.turn}")
     
     # Print all debaters with value 4
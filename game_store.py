@@ -0,0 +1,240 @@
+"""
+Saved games as an append-only JSON Lines journal.
+
+The first line is a snapshot of the roster state (available/committed
+debaters), the current turn and the events in play. Every later line is one
+event, appended and flushed as it happens, so saving costs O(1) per debate:
+
+    {"t": "debate", ...}           a resolved debate (dice, rolls, outcome)
+    {"t": "available", "name", "value"}
+    {"t": "committed", "name", "value"}
+    {"t": "reset_committed"}
+    {"t": "turn", "turn"}
+    {"t": "events", "events"}
+
+Events are saved as rule ids, and the snapshot records the RuleSet.key()
+of the rules they belong to; a journal only loads with the same rules.
+
+Loading replays the journal on top of the snapshot. compact() rewrites the
+file as a fresh snapshot followed by the debate history only.
+"""
+import json
+import os
+
+from debaters import registry
+from roster import RosterArrays
+from rules import DEFAULT_RULES
+
+JOURNAL_VERSION = 2
+
+
+def _row(registry, name):
+    row = registry.row_of(name)
+    if row is None:
+        raise ValueError(f"Unknown debater {name!r} in journal")
+    return row
+
+
+def _events(rules, events):
+    """Check a journal's list of rule ids against the rules in use."""
+    events = list(events)
+    for rule_id in events:
+        if rule_id not in rules.by_id:
+            raise ValueError(f"Unknown event {rule_id!r} in journal")
+    return events
+
+
+class GameState:
+    """Everything a journal describes: roster flags, turn, events and history."""
+
+    def __init__(self, roster, turn=1, events=(), history=None, rules=DEFAULT_RULES):
+        self.roster = roster
+        self.turn = turn
+        self.rules = rules
+        self.events = _events(rules, events)  # rule ids in play
+        self.history = history if history is not None else []  # debate records
+
+    def snapshot(self):
+        reg = self.roster.registry
+        return {
+            "t": "snapshot",
+            "version": JOURNAL_VERSION,
+            "turn": self.turn,
+            "rules": self.rules.key(),
+            "events": self.events,
+            "available": [reg.at_row(r).name for r in self.roster.available.nonzero()[0]],
+            "committed": [reg.at_row(r).name for r in self.roster.committed.nonzero()[0]],
+        }
+
+    def apply(self, event):
+        """Apply one journal event."""
+        kind = event["t"]
+        reg = self.roster.registry
+        if kind == "debate":
+            self.history.append(event)
+        elif kind == "available":
+            self.roster.available[_row(reg, event["name"])] = event["value"]
+        elif kind == "committed":
+            self.roster.committed[_row(reg, event["name"])] = event["value"]
+        elif kind == "reset_committed":
+            self.roster.reset_committed()
+        elif kind == "turn":
+            self.turn = event["turn"]
+        elif kind == "events":
+            self.events = _events(self.rules, event["events"])
+        else:
+            raise ValueError(f"Unknown journal event: {kind!r}")
+
+    @classmethod
+    def from_snapshot(cls, snapshot, registry=registry, rules=DEFAULT_RULES):
+        if snapshot.get("t") != "snapshot":
+            raise ValueError("Game journal must start with a snapshot")
+        version = snapshot.get("version", 0)
+        if version > JOURNAL_VERSION:
+            raise ValueError(f"Game journal version {version} is newer than supported")
+        if version < JOURNAL_VERSION:
+            # Version 1 saved events as positions in the rules file
+            raise ValueError(f"Game journal version {version} is too old to load")
+        if snapshot["rules"] != rules.key():
+            raise ValueError(f"Game journal was saved with different event rules "
+                             f"(key {snapshot['rules']}, {rules.name} is {rules.key()})")
+        roster = RosterArrays(registry)
+        roster.available[:] = False
+        roster.available[[_row(registry, n) for n in snapshot["available"]]] = True
+        roster.committed[[_row(registry, n) for n in snapshot["committed"]]] = True
+        return cls(roster, snapshot["turn"], snapshot["events"], rules=rules)
+
+
+def debate_record(state, result):
+    """Journal entry for a resolved debate."""
+    mods = state.modifiers
+    return {
+        "t": "debate",
+        "protestant": state.protestant.name,
+        "papal": state.papal.name,
+        "protestant_attacking": state.protestant_attacking,
+        "defender_committed": state.defender_committed,
+        "events": mods.events,
+        "protestant_bonus": mods.protestant_bonus,
+        "papal_bonus": mods.papal_bonus,
+        "protestant_rolls": result.protestant_rolls,
+        "papal_rolls": result.papal_rolls,
+        "winner": result.winner,
+        "margin": result.margin,
+        "loser_eliminated": result.loser_eliminated,
+    }
+
+
+class GameStore:
+    """An open journal file that events are appended to."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+
+    @classmethod
+    def create(cls, path, game):
+        """Start a new journal (replacing any file at path) from a GameState."""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(game.snapshot(), separators=(",", ":")) + "\n")
+        return cls(path)
+
+    @classmethod
+    def open(cls, path, registry=registry, rules=DEFAULT_RULES):
+        """Load a journal; returns (store, GameState) with the store ready for appends."""
+        game = load_game(path, registry, rules)
+        # Appending after a torn last line would glue the next event onto it
+        _drop_torn_line(path)
+        return cls(path), game
+
+    def append(self, event):
+        self._file.write(json.dumps(event, separators=(",", ":")) + "\n")
+        self._file.flush()
+
+    def record_debate(self, state, result):
+        self.append(debate_record(state, result))
+
+    def record_available(self, name, value):
+        self.append({"t": "available", "name": name, "value": bool(value)})
+
+    def record_committed(self, name, value):
+        self.append({"t": "committed", "name": name, "value": bool(value)})
+
+    def record_reset_committed(self):
+        self.append({"t": "reset_committed"})
+
+    def record_turn(self, turn):
+        self.append({"t": "turn", "turn": turn})
+
+    def record_events(self, events):
+        self.append({"t": "events", "events": list(events)})
+
+    def compact(self, game):
+        """
+        Rewrite the journal as a snapshot of `game` plus its debate history.
+        If the rewrite fails the old journal is kept, and appends go on.
+        """
+        self._file.close()
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(json.dumps(game.snapshot(), separators=(",", ":")) + "\n")
+                for record in game.history:
+                    f.write(json.dumps(record, separators=(",", ":")) + "\n")
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        finally:
+            self._file = open(self.path, "a", encoding="utf-8")
+
+    def close(self):
+        self._file.close()
+
+
+def _read_events(path):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                # A last line without its newline was cut short by a crash
+                # mid-append; everything before it is still good
+                if not line.endswith("\n") and not f.read():
+                    return
+                raise
+
+
+def _drop_torn_line(path):
+    """Cut a torn last line (see _read_events) off the end of a journal."""
+    with open(path, "rb+") as f:
+        data = f.read()
+        if not data or data.endswith(b"\n"):
+            return
+        start = data.rfind(b"\n") + 1
+        try:
+            json.loads(data[start:])
+        except ValueError:
+            f.truncate(start)
+        else:
+            f.write(b"\n")
+
+
+def load_game(path, registry=registry, rules=DEFAULT_RULES):
+    """Rebuild the GameState a journal describes; ValueError if it used other rules."""
+    events = _read_events(path)
+    try:
+        game = GameState.from_snapshot(next(events), registry, rules)
+    except StopIteration:
+        raise ValueError(f"{path} is empty") from None
+    for event in events:
+        game.apply(event)
+    return game
+
+
+def iter_debates(path):
+    """Yield just the debate records of a journal, for bulk analysis."""
+    return (event for event in _read_events(path) if event["t"] == "debate")
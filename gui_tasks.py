@@ -0,0 +1,153 @@
+"""
+Background tasks for the Qt window.
+
+Long computations run on a QThreadPool. A task function is called as
+fn(task, *args) and can call task.progress(done, total) and
+task.partial(value) to stream results back; it should return promptly once
+task.cancelled is true. Everything is delivered to the window through
+queued signals, so slots run on the GUI thread.
+
+TaskRunner coalesces requests by key: submitting again under the same key
+cancels the running task and restarts the debounce timer, so flicking
+through event checkboxes only computes the last combination.
+
+shutdown() cancels a runner's tasks and waits for the pool; the window
+calls it when closed. One exit hook does the same for runners still live
+at interpreter exit, so a task still running then (e.g. the matchup table
+build) is not torn down mid-flight.
+"""
+import atexit
+import threading
+import weakref
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+
+# Runners not shut down yet; held weakly so a closed window's runner can go
+_live_runners = weakref.WeakSet()
+
+
+@atexit.register
+def _shutdown_live_runners():
+    for runner in list(_live_runners):
+        runner.cancel_all()
+    QThreadPool.globalInstance().waitForDone()
+
+
+class TaskSignals(QObject):
+    progress = pyqtSignal(int, int)
+    partial = pyqtSignal(object)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class BackgroundTask(QRunnable):
+    def __init__(self, fn, *args):
+        super().__init__()
+        # The runner keeps the Python reference; don't let the pool delete it
+        self.setAutoDelete(False)
+        self.fn = fn
+        self.args = args
+        self.signals = TaskSignals()
+        self._cancel = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    @property
+    def cancel_event(self):
+        """threading.Event set on cancel, for helpers like parallel.run_sharded."""
+        return self._cancel
+
+    def cancel(self):
+        self._cancel.set()
+
+    def progress(self, done, total):
+        if not self.cancelled:
+            self.signals.progress.emit(done, total)
+
+    def partial(self, value):
+        if not self.cancelled:
+            self.signals.partial.emit(value)
+
+    def run(self):
+        try:
+            result = self.fn(self, *self.args)
+        except Exception as e:  # reported to the window rather than lost in the pool
+            if not self.cancelled:
+                self.signals.failed.emit(f"{type(e).__name__}: {e}")
+            return
+        if not self.cancelled:
+            self.signals.finished.emit(result)
+
+
+class TaskRunner(QObject):
+    """Runs BackgroundTasks on a thread pool, at most one live task per key."""
+
+    def __init__(self, parent=None, debounce_ms=150):
+        super().__init__(parent)
+        self.pool = QThreadPool.globalInstance()
+        self.debounce_ms = debounce_ms
+        self._running = {}  # key -> BackgroundTask
+        self._timers = {}   # key -> QTimer
+        _live_runners.add(self)
+
+    def submit(self, key, fn, *args, on_finished=None, on_partial=None,
+               on_progress=None, on_failed=None, debounce=False):
+        """
+        Start fn(task, *args) in the background, cancelling any task already
+        running under `key`. With debounce=True the start is delayed so that
+        rapid repeated submissions collapse into one.
+        """
+        self.cancel(key)
+        task = BackgroundTask(fn, *args)
+        for signal, slot in ((task.signals.finished, on_finished),
+                             (task.signals.partial, on_partial),
+                             (task.signals.progress, on_progress),
+                             (task.signals.failed, on_failed)):
+            if slot is not None:
+                # Drop late deliveries from a task that has been superseded
+                signal.connect(lambda *values, t=task, s=slot: None if t.cancelled else s(*values))
+        task.signals.finished.connect(lambda _, t=task: self._forget(key, t))
+        task.signals.failed.connect(lambda _, t=task: self._forget(key, t))
+        self._running[key] = task
+
+        if debounce:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(lambda t=task: None if t.cancelled else self.pool.start(t))
+            timer.start(self.debounce_ms)
+            self._timers[key] = timer
+        else:
+            self.pool.start(task)
+        return task
+
+    def cancel(self, key):
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.stop()
+            timer.deleteLater()
+        task = self._running.pop(key, None)
+        if task is not None:
+            task.cancel()
+
+    def cancel_all(self):
+        for key in list(self._running):
+            self.cancel(key)
+
+    def shutdown(self):
+        """Cancel every task and wait for the pool to finish them."""
+        self.cancel_all()
+        self.pool.waitForDone()
+        _live_runners.discard(self)
+
+    def is_running(self, key):
+        return key in self._running
+
+    def _forget(self, key, task):
+        if self._running.get(key) is task:
+            del self._running[key]
+            timer = self._timers.pop(key, None)
+            if timer is not None:
+                timer.deleteLater()
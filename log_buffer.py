@@ -0,0 +1,69 @@
+"""
+Bounded line buffer behind the output log.
+
+A ring buffer (deque with maxlen) so long sessions keep a fixed memory
+footprint; `dropped` counts how many old lines fell off the front. All
+eviction happens here. The Qt model (log_view.LogListModel) asks
+evictions() first so it can announce the removed and inserted rows, then
+calls drop_oldest() and extend().
+"""
+from collections import deque
+
+DEFAULT_MAX_LINES = 10_000
+
+
+class LogBuffer:
+    def __init__(self, max_lines=DEFAULT_MAX_LINES):
+        self._lines = deque(maxlen=max_lines)  # None = unbounded
+        self.dropped = 0
+
+    @property
+    def max_lines(self):
+        return self._lines.maxlen
+
+    def __len__(self):
+        return len(self._lines)
+
+    def __getitem__(self, index):
+        return self._lines[index]
+
+    def evictions(self, n):
+        """
+        (buffered lines evicted, new lines kept) if n lines were appended. A
+        batch longer than the cap keeps only its last max_lines lines.
+        """
+        if self.max_lines is None:
+            return 0, n
+        kept = min(n, self.max_lines)
+        return max(0, len(self._lines) + kept - self.max_lines), kept
+
+    def drop_oldest(self, n):
+        """Remove the n oldest lines, counting them as dropped."""
+        n = min(n, len(self._lines))
+        for _ in range(n):
+            self._lines.popleft()
+        self.dropped += n
+
+    def extend(self, lines):
+        """Append lines, evicting the oldest past the cap. Returns how many lines were dropped."""
+        lines = list(lines)
+        evicted, kept = self.evictions(len(lines))
+        self.drop_oldest(evicted)
+        self.dropped += len(lines) - kept
+        self._lines.extend(lines[len(lines) - kept:])
+        return evicted + len(lines) - kept
+
+    def lines(self):
+        return list(self._lines)
+
+    def clear(self):
+        self._lines.clear()
+        self.dropped = 0
+
+    def export(self, path):
+        """Write the buffered lines to a text file."""
+        with open(path, "w", encoding="utf-8") as f:
+            if self.dropped:
+                f.write(f"[{self.dropped} earlier line(s) dropped by the {self.max_lines}-line cap]\n")
+            for line in self._lines:
+                f.write(line + "\n")
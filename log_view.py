@@ -0,0 +1,97 @@
+"""
+Virtualised output log for the Qt window.
+
+LogView is a single-column QTableView over a LogBuffer. append() only
+queues text; the queue is flushed into the model once per event-loop pass,
+so a debate that logs a dozen lines costs one model insert and one repaint.
+With fixed row heights the table only touches the rows on screen (QListView
+and QTreeView walk every row on scrollToBottom), so the log's length doesn't
+slow it down.
+"""
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt, QTimer
+from PyQt6.QtWidgets import QAbstractItemView, QHeaderView, QTableView
+
+import profiling
+from log_buffer import DEFAULT_MAX_LINES, LogBuffer
+
+
+class LogListModel(QAbstractListModel):
+    def __init__(self, buffer, parent=None):
+        super().__init__(parent)
+        self.buffer = buffer
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.buffer)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self.buffer[index.row()]
+        return None
+
+    def append_lines(self, lines):
+        if not lines:
+            return
+        # The buffer decides what goes; the model only announces it to the view
+        evict, kept = self.buffer.evictions(len(lines))
+        if evict:
+            self.beginRemoveRows(QModelIndex(), 0, evict - 1)
+            self.buffer.drop_oldest(evict)
+            self.endRemoveRows()
+        start = len(self.buffer)
+        self.beginInsertRows(QModelIndex(), start, start + kept - 1)
+        self.buffer.extend(lines)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self.buffer.clear()
+        self.endResetModel()
+
+
+class LogView(QTableView):
+    """Drop-in for the read-only QTextEdit log: append() text, it shows up batched."""
+
+    def __init__(self, max_lines=DEFAULT_MAX_LINES, parent=None):
+        super().__init__(parent)
+        self.buffer = LogBuffer(max_lines)
+        self.log_model = LogListModel(self.buffer, self)
+        self.setModel(self.log_model)
+        self.horizontalHeader().hide()
+        self.horizontalHeader().setStretchLastSection(True)
+        self.verticalHeader().hide()
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.verticalHeader().setDefaultSectionSize(self.fontMetrics().height() + 2)
+        self.setShowGrid(False)
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.setWordWrap(False)
+        self._pending = []
+
+    def append(self, text):
+        """Queue text (may contain newlines) for the next flush."""
+        if not self._pending:
+            QTimer.singleShot(0, self.flush)
+        self._pending.extend(text.split("\n"))
+
+    @profiling.traced("ui.log_flush")
+    def flush(self):
+        lines, self._pending = self._pending, []
+        if not lines:
+            return
+        at_bottom = self.verticalScrollBar().value() >= self.verticalScrollBar().maximum()
+        self.log_model.append_lines(lines)
+        if at_bottom:
+            self.scrollToBottom()
+
+    def toPlainText(self):
+        self.flush()
+        return "\n".join(self.buffer.lines())
+
+    def clear(self):
+        self._pending = []
+        self.log_model.clear()
+
+    def export(self, path):
+        self.flush()
+        self.buffer.export(path)
@@ -0,0 +1,138 @@
+"""
+Precomputed odds for every Protestant x Papal pairing.
+
+The table covers both attack directions, committed and uncommitted
+defenders and every combination of event flags of a rule set (see rules.py
+and RuleSet.flag). It is built once from the exact odds, saved
+as a .npy file and memory-mapped on later loads, so "best debater to call"
+queries (see advisor.rank_attackers) are plain array indexing.
+
+matchup_cells() is the one place the per-pairing fields are worked out;
+the table stacks it over every flag combination and zone_sweep uses it for
+a single one.
+"""
+import hashlib
+import os
+from functools import lru_cache
+
+import numpy as np
+
+from debate_engine import DebateModifiers, DebateOdds, DebateState, dice_pools, is_protestant
+from debate_odds import margin_pmf
+from debaters import debaters
+from rules import DEFAULT_RULES
+
+# Bump when the table layout or the rules behind it change
+TABLE_VERSION = 2
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
+
+# Last axis of the table
+EXPECTED_MARGIN = 0  # positive = spaces converted to Protestant
+P_PAPAL_DISGRACED = 1
+P_PROTESTANT_BURNED = 2
+P_PROTESTANT_WIN = 3
+P_PAPAL_WIN = 4
+FIELD_COUNT = 5
+
+# Axis 1: who is attacking
+PROTESTANT_ATTACKS = 0
+PAPAL_ATTACKS = 1
+
+
+class MatchupTable:
+    """
+    Wraps a float32 array indexed as
+    [flags, direction, defender_committed, protestant, papal, field].
+    """
+
+    def __init__(self, table, protestants, papals, rules=DEFAULT_RULES):
+        self.table = table
+        self.protestants = protestants
+        self.papals = papals
+        self.rules = rules
+        self.protestant_index = {d.name: i for i, d in enumerate(protestants)}
+        self.papal_index = {d.name: i for i, d in enumerate(papals)}
+
+    def covers(self, modifiers):
+        """Whether the table holds the odds under these modifiers (it has no bonus dice)."""
+        return (modifiers.rules is self.rules
+                and not modifiers.protestant_bonus and not modifiers.papal_bonus)
+
+    def indices(self, debaters, protestant):
+        """Table indices of debaters on one side; KeyError if one is not in the table."""
+        index = self.protestant_index if protestant else self.papal_index
+        return np.array([index[d.name] for d in debaters], dtype=np.intp)
+
+
+@lru_cache(maxsize=4096)
+def _fields(protestant_dice, papal_dice, protestant_value, papal_value):
+    """The table fields for one combination of dice and debate values."""
+    odds = DebateOdds(margin_pmf(protestant_dice, papal_dice), protestant_value, papal_value)
+    fields = [0.0] * FIELD_COUNT
+    fields[EXPECTED_MARGIN] = odds.expected_margin
+    fields[P_PAPAL_DISGRACED] = odds.p_papal_disgraced
+    fields[P_PROTESTANT_BURNED] = odds.p_protestant_burned
+    fields[P_PROTESTANT_WIN] = odds.p_protestant_win
+    fields[P_PAPAL_WIN] = odds.p_papal_win
+    return tuple(fields)
+
+
+def matchup_cells(protestants, papals, modifiers=None):
+    """
+    Float array [direction, defender_committed, protestant, papal, field]
+    for one set of modifiers. Pairings with the same dice and debate values
+    share one computation.
+    """
+    modifiers = modifiers if modifiers is not None else DebateModifiers()
+    cells = np.empty((2, 2, len(protestants), len(papals), FIELD_COUNT))
+    for direction, protestant_attacking in ((PROTESTANT_ATTACKS, True), (PAPAL_ATTACKS, False)):
+        for committed in (0, 1):
+            for i, protestant in enumerate(protestants):
+                for j, papal in enumerate(papals):
+                    state = DebateState(protestant, papal, protestant_attacking,
+                                        defender_committed=bool(committed),
+                                        modifiers=modifiers)
+                    protestant_dice, papal_dice, _ = dice_pools(state)
+                    cells[direction, committed, i, j] = _fields(
+                        protestant_dice, papal_dice, protestant.debate_value, papal.debate_value)
+    return cells
+
+
+def build_matchup_table(roster=debaters, rules=DEFAULT_RULES):
+    """Compute the full table from the exact odds."""
+    protestants = [d for d in roster if is_protestant(d)]
+    papals = [d for d in roster if not is_protestant(d)]
+    table = np.zeros((1 << len(rules), 2, 2, len(protestants), len(papals), FIELD_COUNT),
+                     dtype=np.float32)
+    for flags in range(1 << len(rules)):
+        table[flags] = matchup_cells(protestants, papals,
+                                     DebateModifiers.from_flags(flags, rules=rules))
+    return MatchupTable(table, protestants, papals, rules)
+
+
+def roster_key(roster=debaters, rules=DEFAULT_RULES):
+    """Short hash of everything the table depends on, used in the cache file name."""
+    h = hashlib.sha1(f"v{TABLE_VERSION}|{rules.key()}".encode())
+    for d in roster:
+        h.update(f"|{d.name},{d.debate_value},{d.language_zone}".encode())
+    return h.hexdigest()[:12]
+
+
+def load_matchup_table(roster=debaters, cache_dir=CACHE_DIR, rules=DEFAULT_RULES):
+    """Memory-map the cached table for this roster, building and saving it if missing."""
+    path = os.path.join(cache_dir, f"matchup_table-{roster_key(roster, rules)}.npy")
+    protestants = [d for d in roster if is_protestant(d)]
+    papals = [d for d in roster if not is_protestant(d)]
+
+    if os.path.exists(path):
+        return MatchupTable(np.load(path, mmap_mode="r"), protestants, papals, rules)
+
+    matchups = build_matchup_table(roster, rules)
+    os.makedirs(cache_dir, exist_ok=True)
+    # Write to a temp file first so a concurrent reader never sees half a table
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, matchups.table)
+    os.replace(tmp_path, path)
+    return matchups
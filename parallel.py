@@ -0,0 +1,121 @@
+"""
+Multi-core simulation runner.
+
+Work is cut into fixed-size shards and shard i always gets the seed
+SeedSequence(root, spawn_key=(i,)), whatever the number of workers. Shard
+results are merged in shard order, so the same seed gives bit-identical
+aggregates on 1 worker or 32.
+"""
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+import profiling
+from campaign import CampaignSettings, CampaignSummary, campaign_rng, play_campaign
+from debate_engine import dice_pools
+from debate_montecarlo import CHUNK_SIZE, odds_from_counts, simulate_margins
+
+# Campaigns per shard; small enough for smooth progress, big enough to
+# amortise the inter-process round trip
+CAMPAIGN_SHARD_SIZE = 50
+
+
+class SimulationCancelled(Exception):
+    pass
+
+
+def shard_seed(seed_seq, index):
+    """Seed for shard `index`; depends only on the root seed and the index."""
+    return np.random.SeedSequence(seed_seq.entropy, spawn_key=seed_seq.spawn_key + (index,))
+
+
+@profiling.traced("sim.run_sharded")
+def run_sharded(func, shard_args, workers=None, progress=None, cancel=None):
+    """
+    Call func(*args) for every entry of shard_args across a process pool.
+
+    Returns the results in shard order. progress(done, total) is called as
+    shards finish; if cancel.is_set() becomes true, pending shards are
+    dropped and SimulationCancelled is raised.
+    """
+    total = len(shard_args)
+    workers = workers or os.cpu_count() or 1
+    results = [None] * total
+
+    if workers == 1 or total <= 1:
+        for i, args in enumerate(shard_args):
+            if cancel is not None and cancel.is_set():
+                raise SimulationCancelled()
+            results[i] = func(*args)
+            if progress:
+                progress(i + 1, total)
+        return results
+
+    # spawn rather than fork: callers include the Qt window, and forking a
+    # process that has running threads is not safe
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(workers, total), mp_context=context) as pool:
+        futures = {pool.submit(func, *args): i for i, args in enumerate(shard_args)}
+        pending = set(futures)
+        done_count = 0
+        try:
+            while pending:
+                # Wake up periodically so cancellation is noticed promptly
+                done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                if cancel is not None and cancel.is_set():
+                    raise SimulationCancelled()
+                for future in done:
+                    results[futures[future]] = future.result()
+                    done_count += 1
+                    if progress:
+                        progress(done_count, total)
+        except BaseException:
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+    return results
+
+
+# -----------------------------------------------------------------------------
+# Monte Carlo odds
+# -----------------------------------------------------------------------------
+def _margin_shard(protestant_dice, papal_dice, trials, seed):
+    return simulate_margins(protestant_dice, papal_dice, trials, np.random.default_rng(seed))
+
+
+def parallel_estimate_odds(state, trials=10_000_000, seed=None, workers=None,
+                           shard_trials=CHUNK_SIZE, progress=None, cancel=None):
+    """estimate_odds() for very large trial counts, sharded across processes."""
+    protestant_dice, papal_dice, _ = dice_pools(state)
+    seed_seq = np.random.SeedSequence(seed)
+    shard_args = [
+        (protestant_dice, papal_dice, min(shard_trials, trials - start), shard_seed(seed_seq, i))
+        for i, start in enumerate(range(0, trials, shard_trials))
+    ]
+    counts = sum(run_sharded(_margin_shard, shard_args, workers, progress, cancel))
+    return odds_from_counts(counts, papal_dice,
+                            state.protestant.debate_value, state.papal.debate_value)
+
+
+# -----------------------------------------------------------------------------
+# Campaigns
+# -----------------------------------------------------------------------------
+def _campaign_shard(settings, seed_seq, start, stop):
+    return [play_campaign(settings, campaign_rng(seed_seq, i)) for i in range(start, stop)]
+
+
+def parallel_run_campaigns(n, settings=None, seed=None, workers=None,
+                           shard_size=CAMPAIGN_SHARD_SIZE, progress=None, cancel=None):
+    """
+    run_campaigns() across processes. Campaign i is seeded exactly as in
+    run_campaigns(), so the summary matches the single-process one.
+    Strategies in settings must be picklable (module-level functions).
+    """
+    settings = settings if settings is not None else CampaignSettings()
+    seed_seq = np.random.SeedSequence(seed)
+    shard_args = [(settings, seed_seq, start, min(start + shard_size, n))
+                  for start in range(0, n, shard_size)]
+    shards = run_sharded(_campaign_shard, shard_args, workers, progress, cancel)
+    results = [result for shard in shards for result in shard]
+    return CampaignSummary.from_results(settings.registry, results, seed_seq.entropy)
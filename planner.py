@@ -0,0 +1,261 @@
+"""
+Plan the order of one side's debate calls within a turn.
+
+Calling order matters: every debate commits its defender, and committed
+defenders only get +1 die instead of +2. A defender can also be disgraced
+or burned and leave play. The planner runs an expectimax search over the
+roster state, i.e. the available and committed bitmasks under a set of
+event flags:
+
+    V(state, k) = max(0, max over attackers a of
+                  mean over defenders d of
+                  E[spaces | a, d] + P(d eliminated) * V(d removed, k-1)
+                                   + P(d survives)   * V(d committed, k-1))
+
+The attacker is committed after a call whether or not it is burned, so its
+own fate does not change the rest of the turn. Defenders are drawn uniformly
+from the available debaters of the other side, as in the GUI.
+
+Two things keep the full roster tractable. Debaters that look identical to
+the dice rules under the events in play (same value, and the same outcome
+for every condition of the active rules, see RuleSet.signature) are
+interchangeable. So the
+available/committed bitmasks are canonicalised into counts of each kind of
+debater in each state, the transposition cache is keyed on those counts,
+and only one attacker of each kind is tried. Branches whose optimistic
+bound (immediate value + k-1 times the best possible single call) cannot
+beat the best call found so far are skipped.
+
+On the full 29-debater roster a turn's worth of calls (up to four) plans in
+about a second or less; each further call multiplies the work by roughly 5-10.
+"""
+import profiling
+from debate_engine import DebateModifiers, DebateState
+from debate_odds import exact_odds
+
+
+def rules_signature(debater, modifiers):
+    """Everything about a debater the dice rules look at under these modifiers."""
+    return (debater.debate_value, *modifiers.rules.signature(debater, modifiers.flags))
+
+
+class TurnPlan:
+    def __init__(self, expected_spaces, order, nodes, cache_size):
+        self.expected_spaces = expected_spaces
+        self.order = order  # attackers to call if each debate goes the most likely way
+        self.nodes = nodes
+        self.cache_size = cache_size
+
+    @property
+    def next_call(self):
+        return self.order[0] if self.order else None
+
+
+class TurnPlanner:
+    """
+    Search over one side's calls for the given roster, zone/turn mask and
+    modifiers. The transposition cache persists between plan() calls, so
+    re-planning after each debate is close to free.
+    """
+
+    def __init__(self, roster, protestant_attacking, modifiers=None, mask=None):
+        self.roster = roster
+        self.protestant_attacking = protestant_attacking
+        self.modifiers = modifiers if modifiers is not None else DebateModifiers()
+        registry = roster.registry
+        if mask is None:
+            mask = roster.visible_mask()
+
+        side = roster.protestant if protestant_attacking else ~roster.protestant
+        self.attacker_classes = self._classify((side & mask).nonzero()[0].tolist())
+        self.defender_classes = self._classify((~side & mask).nonzero()[0].tolist())
+
+        # (expected spaces for the attacker, P(defender eliminated)) by
+        # [attacker class][defender class][defender committed]
+        self.pair_odds = []
+        for attackers in self.attacker_classes:
+            attacker = registry.at_row(attackers[0])
+            by_defender = []
+            for defenders in self.defender_classes:
+                defender = registry.at_row(defenders[0])
+                by_defender.append([self._pair(attacker, defender, committed)
+                                    for committed in (False, True)])
+            self.pair_odds.append(by_defender)
+
+        # Best expected spaces any single call by each attacker class can make
+        self.best_call_value = [
+            max((max(0.0, e) for col in row for e, _ in col), default=0.0)
+            for row in self.pair_odds
+        ]
+        # Attacker classes, best first, for the pruning bound
+        self._bound_order = sorted(range(len(self.pair_odds)),
+                                   key=lambda i: -self.best_call_value[i])
+        self.cache = {}
+        self.nodes = 0
+
+    def _classify(self, rows):
+        """Group rows into lists of debaters that are interchangeable for the dice."""
+        classes = {}
+        for row in rows:
+            sig = rules_signature(self.roster.registry.at_row(row), self.modifiers)
+            classes.setdefault(sig, []).append(row)
+        return list(classes.values())
+
+    def _pair(self, attacker, defender, committed):
+        protestant, papal = ((attacker, defender) if self.protestant_attacking
+                             else (defender, attacker))
+        odds = exact_odds(DebateState(protestant, papal, self.protestant_attacking,
+                                      defender_committed=committed, modifiers=self.modifiers))
+        if self.protestant_attacking:
+            return odds.expected_margin, odds.p_papal_disgraced
+        return -odds.expected_margin, odds.p_protestant_burned
+
+    # -------------------------------------------------------------------------
+    # Search
+    # -------------------------------------------------------------------------
+    @profiling.traced("planner.plan")
+    def plan(self, calls, available=None, committed=None):
+        """
+        Best expected net spaces from up to `calls` debates, and the call
+        order along the most likely line of play: after each call the
+        defender is taken from the most numerous kind on the other side,
+        and it stays in play (committed) unless it is more likely than not
+        to be eliminated. Only next_call holds whatever happens, so re-plan
+        after each debate once the defender and outcome are known.
+        available/committed are roster bitmasks (bit i = row i) and default
+        to the roster's current state.
+        """
+        if available is None:
+            available = self._to_bits(self.roster.available)
+        if committed is None:
+            committed = self._to_bits(self.roster.committed)
+        attackers, fresh, used = self.state_counts(available, committed)
+        self.nodes = 0
+        value, _ = self._search(attackers, fresh, used, calls)
+
+        # Walk the most likely line: each call uses up one attacker of the
+        # chosen kind and commits or removes the likeliest defender
+        order = []
+        free_rows = [[r for r in rows if (available & ~committed) >> r & 1]
+                     for rows in self.attacker_classes]
+        while calls > 0:
+            _, best = self._search(attackers, fresh, used, calls)
+            if best is None:
+                break
+            order.append(self.roster.registry.at_row(free_rows[best].pop(0)))
+            attackers = attackers[:best] + (attackers[best] - 1,) + attackers[best + 1:]
+            fresh, used = self._likely_outcome(best, fresh, used)
+            calls -= 1
+        return TurnPlan(value, order, self.nodes, len(self.cache))
+
+    def _likely_outcome(self, attacker_class, fresh, used):
+        """Defender counts after the most likely debate for an attacker of this class."""
+        j, was_committed = max(((j, c) for j in range(len(fresh)) for c in (False, True)),
+                               key=lambda jc: (used if jc[1] else fresh)[jc[0]])
+        _, p_out = self.pair_odds[attacker_class][j][was_committed]
+        counts = used if was_committed else fresh
+        counts = counts[:j] + (counts[j] - 1,) + counts[j + 1:]
+        if was_committed:
+            used = counts
+        else:
+            fresh = counts
+        if p_out < 0.5:
+            used = used[:j] + (used[j] + 1,) + used[j + 1:]
+        return fresh, used
+
+    def _to_bits(self, flags):
+        bits = 0
+        for row in flags.nonzero()[0].tolist():
+            bits |= 1 << row
+        return bits
+
+    def state_counts(self, available, committed):
+        """
+        Canonical form of the roster bitmasks: free attackers per class, and
+        uncommitted / committed available defenders per class.
+        """
+        free = available & ~committed
+        in_use = available & committed
+
+        def count(rows, bits):
+            return sum(1 for r in rows if bits >> r & 1)
+
+        return (tuple(count(rows, free) for rows in self.attacker_classes),
+                tuple(count(rows, free) for rows in self.defender_classes),
+                tuple(count(rows, in_use) for rows in self.defender_classes))
+
+    def _future_bound(self, attackers, called, calls):
+        """
+        Optimistic value of `calls` more debates after calling class `called`:
+        the best single-call values of the attackers that would be left.
+        """
+        bound = 0.0
+        for c in self._bound_order:
+            if calls <= 0:
+                break
+            n = min(attackers[c] - (c == called), calls)
+            bound += n * self.best_call_value[c]
+            calls -= n
+        return bound
+
+    def _search(self, attackers, fresh, used, calls):
+        """(value, attacker class to call next) for a state; class is None to stop."""
+        if calls == 0:
+            return 0.0, None
+        key = (calls, attackers, fresh, used)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        self.nodes += 1
+
+        n_defenders = sum(fresh) + sum(used)
+        candidates = [i for i, n in enumerate(attackers) if n]
+        if not candidates or not n_defenders:
+            self.cache[key] = (0.0, None)
+            return 0.0, None
+
+        defenders = [j for j in range(len(fresh)) if fresh[j] or used[j]]
+        immediate = {
+            i: sum(fresh[j] * self.pair_odds[i][j][0][0] + used[j] * self.pair_odds[i][j][1][0]
+                   for j in defenders) / n_defenders
+            for i in candidates
+        }
+        # Try the most promising attackers first so the bound prunes more
+        candidates.sort(key=lambda i: -immediate[i])
+        best_value, best_class = 0.0, None  # stopping is always allowed
+
+        for i in candidates:
+            if immediate[i] + self._future_bound(attackers, i, calls - 1) <= best_value:
+                continue
+            value = immediate[i]
+            if calls > 1:
+                after = attackers[:i] + (attackers[i] - 1,) + attackers[i + 1:]
+                future = 0.0
+                for j in defenders:
+                    if fresh[j]:
+                        # An uncommitted defender either leaves play or becomes committed
+                        _, p_out = self.pair_odds[i][j][0]
+                        fresh_less = fresh[:j] + (fresh[j] - 1,) + fresh[j + 1:]
+                        used_more = used[:j] + (used[j] + 1,) + used[j + 1:]
+                        v = (1 - p_out) * self._search(after, fresh_less, used_more, calls - 1)[0]
+                        if p_out:
+                            v += p_out * self._search(after, fresh_less, used, calls - 1)[0]
+                        future += fresh[j] * v
+                    if used[j]:
+                        _, p_out = self.pair_odds[i][j][1]
+                        v = (1 - p_out) * self._search(after, fresh, used, calls - 1)[0]
+                        if p_out:
+                            used_less = used[:j] + (used[j] - 1,) + used[j + 1:]
+                            v += p_out * self._search(after, fresh, used_less, calls - 1)[0]
+                        future += used[j] * v
+                value += future / n_defenders
+            if value > best_value:
+                best_value, best_class = value, i
+
+        self.cache[key] = (best_value, best_class)
+        return best_value, best_class
+
+
+def plan_turn(roster, protestant_attacking, calls, modifiers=None, mask=None):
+    """Convenience wrapper: plan one side's calls on the roster's current state."""
+    return TurnPlanner(roster, protestant_attacking, modifiers, mask).plan(calls)
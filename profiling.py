@@ -0,0 +1,217 @@
+"""
+Optional timing spans and counters for the hot paths.
+
+Off by default. Set HIS_PROFILE before starting the program to turn it on:
+
+    HIS_PROFILE=stats python debate_resolver.py        # table on stderr at exit
+    HIS_PROFILE=trace.json python debate_resolver.py   # Chrome trace at exit
+
+Trace files open in chrome://tracing or https://ui.perfetto.dev; counter
+totals are stored under "otherData". Worker processes (see parallel.py)
+write their own trace next to the main one, suffixed with their pid.
+
+Instrumented code uses
+
+    @profiling.traced("ui.filter")       # time every call of a function
+    with profiling.span("sim.batch"):    # time a block
+    profiling.count("rolls", n)          # add to a counter
+
+traced() wrappers take any arguments, so use span() inside Qt slots that are
+connected straight to a signal: PyQt would pass them the signal's arguments.
+
+When profiling is off, traced() returns the function unchanged, span()
+returns a shared no-op context manager and count() does nothing, so the
+hooks can stay in production code. traced() decides at import time, which
+the environment variable takes care of; enable() later only affects span()
+and count().
+"""
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+
+ENV_VAR = "HIS_PROFILE"
+# Set to the pid of the first profiled process, so child processes (which
+# inherit it) can tell they are not the main one
+MAIN_PID_ENV_VAR = "HIS_PROFILE_MAIN_PID"
+
+# Spans kept for the trace file; later ones still count towards the stats
+MAX_TRACE_EVENTS = 1_000_000
+
+
+class Profiler:
+    """Collects spans and counters for one process."""
+
+    def __init__(self, trace_path=None):
+        self.trace_path = trace_path
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+        self.events = []  # Chrome trace "complete" events
+        self.dropped_events = 0
+        self.spans = defaultdict(lambda: [0, 0.0, 0.0])  # name -> [calls, total s, max s]
+        self.counters = defaultdict(int)
+        self.lock = threading.Lock()
+
+    def record(self, name, start, end):
+        duration = end - start
+        with self.lock:
+            stats = self.spans[name]
+            stats[0] += 1
+            stats[1] += duration
+            if duration > stats[2]:
+                stats[2] = duration
+            if len(self.events) < MAX_TRACE_EVENTS:
+                self.events.append({
+                    "name": name,
+                    "cat": name.split(".", 1)[0],
+                    "ph": "X",
+                    "ts": (start - self.origin) * 1e6,
+                    "dur": duration * 1e6,
+                    "pid": self.pid,
+                    "tid": threading.get_ident(),
+                })
+            else:
+                self.dropped_events += 1
+
+    def add(self, name, n):
+        with self.lock:
+            self.counters[name] += n
+
+    def stats(self):
+        """{"spans": {name: {calls, total_ms, mean_ms, max_ms}}, "counters": {name: n}}"""
+        with self.lock:
+            spans = {
+                name: {"calls": calls, "total_ms": total * 1e3,
+                       "mean_ms": total * 1e3 / calls, "max_ms": longest * 1e3}
+                for name, (calls, total, longest) in sorted(self.spans.items())
+            }
+            return {"spans": spans, "counters": dict(sorted(self.counters.items()))}
+
+    def dump_stats(self, file=None):
+        """Print the span and counter tables."""
+        file = sys.stderr if file is None else file
+        stats = self.stats()
+        print(f"{'span':<32}{'calls':>10}{'total ms':>12}{'mean ms':>10}{'max ms':>10}", file=file)
+        for name, s in stats["spans"].items():
+            print(f"{name:<32}{s['calls']:>10,}{s['total_ms']:>12.2f}"
+                  f"{s['mean_ms']:>10.3f}{s['max_ms']:>10.2f}", file=file)
+        print(f"{'counter':<32}{'value':>10}", file=file)
+        for name, n in stats["counters"].items():
+            print(f"{name:<32}{n:>10,}", file=file)
+
+    def write_trace(self, path):
+        """Write the spans as Chrome trace JSON."""
+        stats = self.stats()
+        with self.lock:
+            events = list(self.events)
+        trace = {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"counters": stats["counters"], "dropped_events": self.dropped_events},
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(trace, f)
+
+    def finish(self):
+        """Write the trace file, or the stats if there is none. Registered with atexit."""
+        if self.trace_path:
+            self.write_trace(self.trace_path)
+        else:
+            self.dump_stats()
+
+
+# -----------------------------------------------------------------------------
+# Hooks. These are the disabled versions; enable() swaps in the real ones.
+# -----------------------------------------------------------------------------
+profiler = None  # the active Profiler, or None when profiling is off
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        profiler.record(self.name, self.start, time.perf_counter())
+        return False
+
+
+def span(name):
+    return _NULL_SPAN
+
+
+def count(name, n=1):
+    pass
+
+
+def _span(name):
+    return _Span(name)
+
+
+def _count(name, n=1):
+    profiler.add(name, n)
+
+
+def traced(name):
+    """Decorator timing every call of a function as a span called `name`."""
+    def decorate(func):
+        if profiler is None:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.record(name, start, time.perf_counter())
+
+        return wrapper
+    return decorate
+
+
+def enable(target="stats"):
+    """
+    Turn profiling on for this process. target is "stats" for a table on
+    stderr at exit, or a path to write a Chrome trace to.
+    """
+    global profiler, span, count
+    if profiler is not None:
+        return profiler
+    main_pid = os.environ.setdefault(MAIN_PID_ENV_VAR, str(os.getpid()))
+    trace_path = None
+    if target not in ("1", "stats"):
+        trace_path = target
+        if main_pid != str(os.getpid()):
+            root, ext = os.path.splitext(target)
+            trace_path = f"{root}.{os.getpid()}{ext}"
+    profiler = Profiler(trace_path)
+    span, count = _span, _count
+    atexit.register(profiler.finish)
+    return profiler
+
+
+if os.environ.get(ENV_VAR):
+    enable(os.environ[ENV_VAR])
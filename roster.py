@@ -0,0 +1,68 @@
+"""
+Struct-of-arrays view of a debater roster.
+
+One NumPy array per field (turn, debate value, zone code, available,
+committed) so filtering by turn/zone and batch simulations work on whole
+columns at once. Row i matches row i of the DebaterRegistry it was built
+from, and the mutable available/committed state lives here only.
+"""
+import numpy as np
+
+import profiling
+from debaters import CATHOLIC, ZONE_CODES, registry
+
+ALL_ZONES = "All"
+
+
+class RosterArrays:
+    __slots__ = ("registry", "turn", "debate_value", "zone", "protestant",
+                 "optional", "available", "committed")
+
+    def __init__(self, registry=registry):
+        self.registry = registry
+        ds = registry.debaters
+        self.turn = np.array([d.turn for d in ds], dtype=np.int16)
+        self.debate_value = np.array([d.debate_value for d in ds], dtype=np.int8)
+        self.zone = np.array([ZONE_CODES[d.language_zone] for d in ds], dtype=np.int8)
+        self.protestant = self.zone != ZONE_CODES[CATHOLIC]
+        self.optional = np.array([d.optional for d in ds], dtype=bool)
+        # Optional debaters start out unavailable until the player brings them in
+        self.available = ~self.optional
+        self.committed = np.zeros(len(ds), dtype=bool)
+
+    def __len__(self):
+        return self.turn.size
+
+    def copy(self):
+        other = RosterArrays.__new__(RosterArrays)
+        for field in self.__slots__:
+            value = getattr(self, field)
+            setattr(other, field, value.copy() if isinstance(value, np.ndarray) else value)
+        return other
+
+    def visible_mask(self, zone=ALL_ZONES, turn=None):
+        """
+        Rows shown for a zone filter and game turn. Papal debaters are always
+        shown regardless of zone.
+        """
+        profiling.count("roster.scans")
+        mask = np.ones(len(self), dtype=bool) if turn is None else self.turn <= turn
+        if zone != ALL_ZONES:
+            mask &= (self.zone == ZONE_CODES[zone]) | ~self.protestant
+        return mask
+
+    def candidates(self, is_protestant, mask=None, uncommitted=False):
+        """Row indices of available debaters on one side, optionally uncommitted only."""
+        profiling.count("roster.scans")
+        rows = self.available & (self.protestant == is_protestant)
+        if mask is not None:
+            rows &= mask
+        if uncommitted:
+            rows &= ~self.committed
+        return np.flatnonzero(rows)
+
+    def row_of(self, debater):
+        return self.registry.row_of(debater.name)
+
+    def reset_committed(self):
+        self.committed[:] = False
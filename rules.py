@@ -0,0 +1,241 @@
+"""
+Event modifiers as data.
+
+The event cards (and any house rules) that change the dice are listed in a
+JSON file, modifiers.json by default, instead of being if-branches in
+debate_engine. Each entry looks like
+
+    {"id": "mary", "label": "Mary I Ruler (...)", "log": "Mary I => ...",
+     "side": "papal", "dice": "papal_value",
+     "when": {"protestant_zone": "English"}}
+
+"side" is who gets the dice, "dice" is a number of dice or one of
+"protestant_value" / "papal_value", and the optional "when" limits the rule
+to some debates. Ids must be unique and cannot be one of RESERVED_IDS.
+Conditions (a single value or a list of values):
+
+    protestant_zone, papal_zone, protestant_name, papal_name, attacker
+
+where attacker is "protestant" or "papal". Rules are numbered in file
+order and rule i is event flag 1 << i. The numbering is only meaningful
+within one process and one rule set: anything saved (journals, scenarios)
+names events by rule id, and checks key() when it stores flags.
+
+A RuleSet is compiled per debate: pair_effects() evaluates the conditions
+for one (protestant, papal, attacker) once, and dice_delta() sums the
+effects for a flag bitmask and caches the result. Batch simulations
+therefore cost the same dict lookup whatever rules are loaded.
+"""
+import hashlib
+import json
+import os
+
+from debaters import CATHOLIC
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "modifiers.json")
+
+SIDES = ("protestant", "papal")
+VALUE_DICE = ("protestant_value", "papal_value")
+CONDITIONS = ("protestant_zone", "papal_zone", "protestant_name", "papal_name", "attacker")
+# Keyword arguments of DebateModifiers, which takes rule ids as keywords too
+RESERVED_IDS = ("protestant_bonus", "papal_bonus", "rules", "flags")
+
+# dice_delta() results kept per rule set before the cache is started afresh
+CACHE_LIMIT = 1 << 16
+
+
+class RulesError(ValueError):
+    pass
+
+
+class ModifierRule:
+    """One entry of a rules file."""
+
+    __slots__ = ("id", "label", "log", "side", "dice", "when", "flag")
+
+    def __init__(self, id, label, side, dice, log=None, when=None, flag=0):
+        self.id = id
+        self.label = label
+        self.log = log if log is not None else label
+        self.side = side
+        self.dice = dice
+        self.when = when or {}  # condition -> tuple of accepted values
+        self.flag = flag
+
+    @classmethod
+    def from_spec(cls, spec, flag):
+        """Validate and build a rule from its dict in the rules file."""
+        if not isinstance(spec, dict):
+            raise RulesError(f"Rule must be a JSON object, got {spec!r}")
+        rule_id = spec.get("id")
+        if not isinstance(rule_id, str) or not rule_id:
+            raise RulesError(f"Rule without an id: {spec!r}")
+        if rule_id in RESERVED_IDS:
+            raise RulesError(f"Rule id {rule_id!r} is reserved")
+        side = spec.get("side")
+        if side not in SIDES:
+            raise RulesError(f"Rule {rule_id!r}: side must be one of {SIDES}, got {side!r}")
+        dice = spec.get("dice")
+        if not (isinstance(dice, int) and not isinstance(dice, bool)) and dice not in VALUE_DICE:
+            raise RulesError(f"Rule {rule_id!r}: dice must be a number or one of {VALUE_DICE}")
+
+        when_spec = spec.get("when") or {}
+        if not isinstance(when_spec, dict):
+            raise RulesError(f"Rule {rule_id!r}: when must be a JSON object, got {when_spec!r}")
+        when = {}
+        for condition, values in when_spec.items():
+            if condition not in CONDITIONS:
+                raise RulesError(f"Rule {rule_id!r}: unknown condition {condition!r}")
+            values = tuple(values) if isinstance(values, list) else (values,)
+            if condition == "attacker" and not set(values) <= set(SIDES):
+                raise RulesError(f"Rule {rule_id!r}: attacker must be one of {SIDES}")
+            when[condition] = values
+        return cls(rule_id, spec.get("label", rule_id), side, dice,
+                   log=spec.get("log"), when=when, flag=flag)
+
+    def applies(self, protestant, papal, protestant_attacking):
+        """Whether the "when" conditions hold for this debate."""
+        for condition, values in self.when.items():
+            if condition == "attacker":
+                actual = "protestant" if protestant_attacking else "papal"
+            else:
+                side, field = condition.split("_")
+                debater = protestant if side == "protestant" else papal
+                actual = debater.language_zone if field == "zone" else debater.name
+            if actual not in values:
+                return False
+        return True
+
+    def dice_for(self, protestant, papal):
+        if self.dice == "protestant_value":
+            return protestant.debate_value
+        if self.dice == "papal_value":
+            return papal.debate_value
+        return self.dice
+
+
+class RuleSet:
+    """An ordered list of ModifierRules, compiled into cached per-debate lookups."""
+
+    def __init__(self, rules, name="custom"):
+        self.rules = list(rules)
+        self.name = name
+        self.by_id = {rule.id: rule for rule in self.rules}
+        if len(self.by_id) != len(self.rules):
+            raise RulesError(f"Duplicate rule ids in {name}")
+        self._effects = {}
+        self._deltas = {}
+
+    @classmethod
+    def from_specs(cls, specs, name="custom"):
+        if not isinstance(specs, list):
+            raise RulesError(f"{name}: expected a JSON list of rules")
+        return cls([ModifierRule.from_spec(spec, 1 << i) for i, spec in enumerate(specs)], name)
+
+    def __len__(self):
+        return len(self.rules)
+
+    def __iter__(self):
+        return iter(self.rules)
+
+    def __getstate__(self):
+        # Caches are per process; workers rebuild their own
+        return {"rules": self.rules, "name": self.name}
+
+    def __setstate__(self, state):
+        self.__init__(state["rules"], state["name"])
+
+    def flag(self, rule_id):
+        """The event flag of a rule; KeyError for an unknown id."""
+        return self.by_id[rule_id].flag
+
+    def flags_for(self, rule_ids):
+        """The event-flag bitmask of some rule ids; KeyError for an unknown id."""
+        flags = 0
+        for rule_id in rule_ids:
+            flags |= self.by_id[rule_id].flag
+        return flags
+
+    def ids_for(self, flags):
+        """The ids of the rules in an event-flag bitmask, in file order."""
+        return [rule.id for rule in self.rules if flags & rule.flag]
+
+    @property
+    def all_flags(self):
+        return (1 << len(self.rules)) - 1
+
+    def key(self):
+        """Short hash of the rules, for cache file names."""
+        specs = [(r.id, r.side, r.dice, sorted(r.when.items())) for r in self.rules]
+        return hashlib.sha1(json.dumps(specs).encode()).hexdigest()[:12]
+
+    def pair_effects(self, protestant, papal, protestant_attacking):
+        """
+        [(flag, protestant dice, papal dice, log line), ...] for the rules
+        whose conditions hold in this debate, whether or not they are in play.
+        """
+        key = (protestant, papal, protestant_attacking)
+        effects = self._effects.get(key)
+        if effects is None:
+            effects = []
+            for rule in self.rules:
+                if rule.applies(protestant, papal, protestant_attacking):
+                    dice = rule.dice_for(protestant, papal)
+                    if rule.side == "protestant":
+                        effects.append((rule.flag, dice, 0, rule.log))
+                    else:
+                        effects.append((rule.flag, 0, dice, rule.log))
+            effects = tuple(effects)
+            if len(self._effects) >= CACHE_LIMIT:
+                self._effects.clear()
+            self._effects[key] = effects
+        return effects
+
+    def dice_delta(self, protestant, papal, protestant_attacking, flags):
+        """(protestant dice, papal dice, log lines) added by the rules in play."""
+        key = (protestant, papal, protestant_attacking, flags)
+        delta = self._deltas.get(key)
+        if delta is None:
+            protestant_dice = papal_dice = 0
+            log = []
+            for flag, p, q, line in self.pair_effects(protestant, papal, protestant_attacking):
+                if flags & flag:
+                    protestant_dice += p
+                    papal_dice += q
+                    log.append(line)
+            delta = (protestant_dice, papal_dice, tuple(log))
+            if len(self._deltas) >= CACHE_LIMIT:
+                self._deltas.clear()
+            self._deltas[key] = delta
+        return delta
+
+    def signature(self, debater, flags):
+        """
+        Everything the rules in play look at about one debater: the outcome
+        of each condition on the debater's own side. Debaters of a side with
+        the same signature and debate value are interchangeable.
+        """
+        side = "papal" if debater.language_zone == CATHOLIC else "protestant"
+        signature = []
+        for rule in self.rules:
+            if not flags & rule.flag:
+                continue
+            for condition, values in rule.when.items():
+                if condition.startswith(side + "_"):
+                    field = condition[len(side) + 1:]
+                    actual = debater.language_zone if field == "zone" else debater.name
+                    signature.append(actual in values)
+        return tuple(signature)
+
+
+def load_rules(path=DEFAULT_RULES_PATH):
+    """Read a rules file into a RuleSet."""
+    with open(path, encoding="utf-8") as f:
+        try:
+            specs = json.load(f)
+        except ValueError as e:
+            raise RulesError(f"{path}: {e}") from None
+    return RuleSet.from_specs(specs, name=os.path.basename(path))
+
+
+DEFAULT_RULES = load_rules()
@@ -0,0 +1,118 @@
+"""
+Debate scenarios as plain dicts, for the CLI and other batch tools.
+
+A scenario looks like
+    {"attacker": "Luther", "defender": "Eck", "defender_committed": false,
+     "events": ["augsburg", "mary"], "protestant_bonus": 0, "papal_bonus": 0}
+Events are rule ids from the rule set in use (modifiers.json by default,
+see rules.py). They may also be given as an integer "flags" bitmask, together
+with "rules": the RuleSet.key() of the rules it was built for, since flags
+are only positions in the rules file. Bonus dice go from 0 to
+MAX_BONUS_DICE, as on the window's spin boxes. Any "id" field is echoed
+back in the result.
+"""
+from debate_engine import DebateModifiers, DebateState, is_protestant
+from debaters import registry
+from rules import DEFAULT_RULES
+
+MAX_BONUS_DICE = 10
+
+
+class ScenarioError(ValueError):
+    pass
+
+
+def _integer(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def bonus_dice(scenario, key):
+    """A scenario's protestant_bonus or papal_bonus, checked against 0..MAX_BONUS_DICE."""
+    value = scenario.get(key, 0)
+    if not _integer(value):
+        raise ScenarioError(f"{key} must be an integer, got {value!r}")
+    if not 0 <= value <= MAX_BONUS_DICE:
+        raise ScenarioError(f"{key} must be between 0 and {MAX_BONUS_DICE}, got {value}")
+    return value
+
+
+def event_flags(scenario, rules=DEFAULT_RULES):
+    """The event-flag bitmask of a scenario dict."""
+    if "flags" in scenario:
+        if scenario.get("rules") != rules.key():
+            raise ScenarioError(f"\"flags\" needs \"rules\": {rules.key()!r} ({rules.name}); "
+                                f"or list the rule ids in \"events\"")
+        flags = scenario["flags"]
+        if not _integer(flags):
+            raise ScenarioError(f"flags must be an integer, got {flags!r}")
+        if flags & ~rules.all_flags:
+            raise ScenarioError(f"Unknown event flags: {flags!r}")
+        return flags
+    events = scenario.get("events", [])
+    if not isinstance(events, list) or not all(isinstance(name, str) for name in events):
+        raise ScenarioError(f"events must be a list of rule ids, got {events!r}")
+    flags = 0
+    for name in events:
+        try:
+            flags |= rules.flag(name)
+        except KeyError:
+            raise ScenarioError(f"Unknown event: {name!r}") from None
+    return flags
+
+
+def scenario_state(scenario, registry=registry, rules=DEFAULT_RULES):
+    """Turn a scenario dict into a DebateState."""
+    for key in ("attacker", "defender"):
+        if key in scenario and not isinstance(scenario[key], str):
+            raise ScenarioError(f"{key} must be a debater name, got {scenario[key]!r}")
+    try:
+        attacker = registry[scenario["attacker"]]
+        defender = registry[scenario["defender"]]
+    except KeyError as e:
+        raise ScenarioError(f"Unknown or missing debater: {e.args[0]!r}") from None
+    protestant_attacking = is_protestant(attacker)
+    if is_protestant(defender) == protestant_attacking:
+        raise ScenarioError(f"{attacker.name} and {defender.name} are on the same side")
+
+    modifiers = DebateModifiers.from_flags(
+        event_flags(scenario, rules),
+        protestant_bonus=bonus_dice(scenario, "protestant_bonus"),
+        papal_bonus=bonus_dice(scenario, "papal_bonus"),
+        rules=rules,
+    )
+    defender_committed = scenario.get("defender_committed", False)
+    if not isinstance(defender_committed, bool):
+        raise ScenarioError(f"defender_committed must be true or false, got {defender_committed!r}")
+    protestant, papal = (attacker, defender) if protestant_attacking else (defender, attacker)
+    return DebateState(protestant, papal, protestant_attacking,
+                       defender_committed=defender_committed, modifiers=modifiers)
+
+
+def result_record(state, result):
+    """JSON-ready dict for a DebateResult."""
+    return {
+        "attacker": state.attacker.name,
+        "defender": state.defender.name,
+        "protestant_dice": result.protestant_dice,
+        "papal_dice": result.papal_dice,
+        "protestant_hits": result.protestant_hits,
+        "papal_hits": result.papal_hits,
+        "winner": result.winner,
+        "margin": result.margin,
+        "protestant_burned": result.protestant_burned,
+        "papal_disgraced": result.papal_disgraced,
+    }
+
+
+def odds_record(state, odds):
+    """JSON-ready dict for a DebateOdds."""
+    return {
+        "attacker": state.attacker.name,
+        "defender": state.defender.name,
+        "p_protestant_win": odds.p_protestant_win,
+        "p_tie": odds.p_tie,
+        "p_papal_win": odds.p_papal_win,
+        "p_papal_disgraced": odds.p_papal_disgraced,
+        "p_protestant_burned": odds.p_protestant_burned,
+        "expected_margin": odds.expected_margin,
+    }
@@ -0,0 +1,41 @@
+import pytest
+
+from advisor import rank_attackers
+from debate_engine import DebateModifiers
+from matchup_table import build_matchup_table, load_matchup_table
+from roster import RosterArrays
+
+
+@pytest.fixture(scope="module")
+def table():
+    return build_matchup_table()
+
+
+@pytest.mark.parametrize("protestant_attacking", [True, False])
+@pytest.mark.parametrize("flags", [0, 0b10110, 0b11111])
+def test_table_ranking_matches_exact(table, protestant_attacking, flags):
+    roster = RosterArrays()
+    roster.committed[[0, 5, 20]] = True
+    modifiers = DebateModifiers.from_flags(flags)
+    exact = rank_attackers(roster, protestant_attacking, modifiers=modifiers)
+    cached = rank_attackers(roster, protestant_attacking, modifiers=modifiers, table=table)
+    assert [a.row for a in cached] == [a.row for a in exact]
+    for a, b in zip(cached, exact):
+        assert a.score == pytest.approx(b.score, abs=1e-5)
+        assert a.p_lost == pytest.approx(b.p_lost, abs=1e-6)
+        assert a.p_win == pytest.approx(b.p_win, abs=1e-6)
+
+
+def test_bonus_dice_fall_back_to_exact_odds(table):
+    roster = RosterArrays()
+    modifiers = DebateModifiers(protestant_bonus=3)
+    assert not table.covers(modifiers)
+    exact = rank_attackers(roster, True, modifiers=modifiers)
+    cached = rank_attackers(roster, True, modifiers=modifiers, table=table)
+    assert [(a.row, a.score) for a in cached] == [(a.row, a.score) for a in exact]
+
+
+def test_load_reuses_cached_file(tmp_path):
+    built = load_matchup_table(cache_dir=tmp_path)
+    loaded = load_matchup_table(cache_dir=tmp_path)
+    assert (loaded.table == built.table).all()
@@ -0,0 +1,14 @@
+import pytest
+
+from campaign import CampaignSettings, run_campaigns
+
+
+def test_unknown_optional_debater_is_rejected():
+    with pytest.raises(ValueError, match="Unknown debater 'Cranmar'"):
+        CampaignSettings(optional_debaters=["Cranmer", "Cranmar"])
+
+
+def test_optional_debaters_come_into_play():
+    summary = run_campaigns(20, CampaignSettings(optional_debaters=["Cranmer"]), seed=3)
+    rates = summary.survival_rates()
+    assert "Cranmer" in rates and "Latimer" not in rates
@@ -0,0 +1,72 @@
+import json
+import random
+
+import pytest
+
+from debate_cli import process_line
+from rules import DEFAULT_RULES
+from scenarios import MAX_BONUS_DICE, ScenarioError, scenario_state
+
+
+def line(**scenario):
+    return json.dumps({"attacker": "Luther", "defender": "Eck", **scenario})
+
+
+@pytest.mark.parametrize("key", ["protestant_bonus", "papal_bonus"])
+@pytest.mark.parametrize("value", [-1, MAX_BONUS_DICE + 1, 10**6, "3", 2.5, True])
+def test_bad_bonus_dice_are_rejected(key, value):
+    with pytest.raises(ScenarioError):
+        scenario_state({"attacker": "Luther", "defender": "Eck", key: value})
+
+
+def test_bonus_dice_in_range():
+    state = scenario_state({"attacker": "Luther", "defender": "Eck",
+                            "protestant_bonus": MAX_BONUS_DICE, "papal_bonus": 0})
+    assert state.modifiers.protestant_bonus == MAX_BONUS_DICE
+
+
+@pytest.mark.parametrize("mode", ["odds", "resolve"])
+def test_bad_line_gives_error_record(mode):
+    rng = random.Random(1)
+    record = process_line(line(id=7, papal_bonus=10**9), mode, rng)
+    assert record["id"] == 7 and "error" in record
+    assert "error" not in process_line(line(id=8), mode, rng)
+
+
+def test_computation_failure_gives_error_record(monkeypatch):
+    def fail(state):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr("debate_cli.exact_odds", fail)
+    record = process_line(line(id=1), "odds", random.Random(1))
+    assert record == {"id": 1, "error": "RuntimeError: boom"}
+
+
+def test_flags_need_the_rules_key():
+    assert "error" in process_line(line(flags=1), "odds", random.Random(1))
+    record = process_line(line(flags=1, rules=DEFAULT_RULES.key()), "odds", random.Random(1))
+    assert "error" not in record
+
+
+@pytest.mark.parametrize("field, value", [
+    ("defender_committed", "false"),
+    ("defender_committed", 0),
+    ("events", "augsburg"),
+    ("events", ["augsburg", 1]),
+    ("flags", "3"),
+    ("flags", 2.7),
+    ("flags", True),
+    ("attacker", ["Luther"]),
+])
+def test_mistyped_fields_are_rejected(field, value):
+    scenario = {"attacker": "Luther", "defender": "Eck", "rules": DEFAULT_RULES.key(),
+                field: value}
+    with pytest.raises(ScenarioError, match=field):
+        scenario_state(scenario)
+
+
+def test_well_typed_fields():
+    state = scenario_state({"attacker": "Eck", "defender": "Luther", "defender_committed": True,
+                            "events": ["augsburg"]})
+    assert state.defender_committed is True
+    assert state.modifiers.events == ["augsburg"]
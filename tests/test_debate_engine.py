@@ -0,0 +1,74 @@
+import pytest
+
+from debate_engine import PAPAL, PROTESTANT, DebateModifiers, DebateState, dice_pools, judge
+from debaters import registry
+from rules import RuleSet
+
+LUTHER = registry["Luther"]        # German, value 4
+TYNDALE = registry["Tyndale"]      # English, value 2
+ECK = registry["Eck"]              # value 3
+GARDINER = registry["Gardiner"]    # value 3
+CAJETAN = registry["Cajetan"]      # value 1
+
+
+def dice(protestant, papal, protestant_attacking=True, committed=False, **modifiers):
+    state = DebateState(protestant, papal, protestant_attacking, defender_committed=committed,
+                        modifiers=DebateModifiers(**modifiers))
+    return dice_pools(state)[:2]
+
+
+def test_attacker_and_defender_bonuses():
+    assert dice(LUTHER, CAJETAN) == (4 + 3, 1 + 2)
+    assert dice(LUTHER, CAJETAN, committed=True) == (4 + 3, 1 + 1)
+    assert dice(LUTHER, CAJETAN, protestant_attacking=False) == (4 + 2, 1 + 3)
+    assert dice(LUTHER, CAJETAN, protestant_attacking=False, committed=True) == (4 + 1, 1 + 3)
+
+
+def test_augsburg():
+    assert dice(LUTHER, ECK, augsburg=True) == (7, 3 + 2 - 1)
+    assert dice(LUTHER, ECK, protestant_attacking=False, augsburg=True) == (6, 3 + 3 - 1)
+
+
+def test_mary_only_against_english_debaters():
+    assert dice(TYNDALE, CAJETAN, mary=True) == (5, 1 + 2 + 1)
+    assert dice(TYNDALE, ECK, protestant_attacking=False, mary=True) == (4, 3 + 3 + 3)
+    assert dice(LUTHER, ECK, mary=True) == dice(LUTHER, ECK)
+
+
+def test_thomas_more_and_inquisition_stack():
+    assert dice(LUTHER, CAJETAN, thomas_more=True) == (7, 4)
+    assert dice(LUTHER, CAJETAN, papal_inquisition=True) == (7, 4)
+    assert dice(LUTHER, CAJETAN, thomas_more=True, papal_inquisition=True) == (7, 5)
+
+
+def test_eck_gardiner_by_name():
+    assert dice(LUTHER, ECK, eck_gardiner=True) == (7, 6)
+    assert dice(TYNDALE, GARDINER, eck_gardiner=True) == (5, 6)
+    assert dice(LUTHER, registry["Pole"], eck_gardiner=True) == dice(LUTHER, registry["Pole"])
+
+
+def test_all_events_together():
+    events = dict(augsburg=True, mary=True, thomas_more=True, papal_inquisition=True,
+                  eck_gardiner=True)
+    assert dice(TYNDALE, GARDINER, **events) == (5, 3 + 2 - 1 + 3 + 1 + 1 + 1)
+
+
+def test_bonus_dice():
+    assert dice(LUTHER, ECK, protestant_bonus=2, papal_bonus=5) == (9, 10)
+
+
+def test_at_least_one_die():
+    rules = RuleSet.from_specs([{"id": "purge", "side": "papal", "dice": -10},
+                                {"id": "schism", "side": "protestant", "dice": -10}])
+    assert dice(LUTHER, CAJETAN, rules=rules, purge=True, schism=True) == (1, 1)
+
+
+@pytest.mark.parametrize("protestant_hits, papal_hits, expected", [
+    (5, 2, (PROTESTANT, 3, False)),   # margin 3 = Eck's value: not disgraced
+    (6, 2, (PROTESTANT, 4, True)),
+    (2, 6, (PAPAL, 4, False)),        # margin 4 = Luther's value: not burned
+    (1, 6, (PAPAL, 5, True)),
+    (3, 3, (None, 0, False)),
+])
+def test_elimination_needs_margin_above_value(protestant_hits, papal_hits, expected):
+    assert judge(DebateState(LUTHER, ECK, True), protestant_hits, papal_hits) == expected
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from debate_engine import DebateModifiers, DebateState
+from debate_montecarlo import adaptive_odds, estimate_odds
+from debate_odds import exact_odds
+from debaters import registry
+
+FIELDS = ("p_protestant_win", "p_tie", "p_papal_win", "p_papal_disgraced",
+          "p_protestant_burned")
+
+STATES = [
+    DebateState(registry["Luther"], registry["Eck"], True),
+    DebateState(registry["Calvin"], registry["Loyola"], False, defender_committed=True),
+    DebateState(registry["Cranmer"], registry["Gardiner"], True,
+                modifiers=DebateModifiers(mary=True, thomas_more=True)),
+]
+
+
+@pytest.mark.parametrize("state", STATES)
+def test_monte_carlo_agrees_with_exact_odds(state):
+    trials = 1_000_000
+    estimate = estimate_odds(state, trials, np.random.default_rng(2024))
+    exact = exact_odds(state)
+    for field in FIELDS:
+        p = getattr(exact, field)
+        # Five standard errors: a false failure is a one-in-millions event
+        tolerance = 5 * (p * (1 - p) / trials) ** 0.5 + 1e-9
+        assert getattr(estimate, field) == pytest.approx(p, abs=tolerance), field
+    assert estimate.expected_margin == pytest.approx(exact.expected_margin, abs=0.01)
+
+
+@pytest.mark.parametrize("state", STATES)
+def test_adaptive_estimate_is_within_its_precision(state):
+    estimate = adaptive_odds(state, half_width=0.005, rng=np.random.default_rng(7))
+    exact = exact_odds(state)
+    assert estimate.precision <= 0.005
+    for field in FIELDS:
+        assert abs(getattr(estimate, field) - getattr(exact, field)) <= 2 * estimate.precision
@@ -0,0 +1,37 @@
+from math import comb
+
+import pytest
+
+from debate_engine import DebateModifiers, DebateState
+from debate_odds import exact_odds, hits_pmf, margin_pmf
+from debaters import registry
+
+
+@pytest.mark.parametrize("dice", [1, 4, 12, 40])
+def test_hits_pmf_matches_binomial(dice):
+    expected = [comb(dice, k) * (1 / 3) ** k * (2 / 3) ** (dice - k) for k in range(dice + 1)]
+    assert hits_pmf(dice) == pytest.approx(expected, rel=1e-12, abs=1e-300)
+
+
+def test_hits_pmf_many_dice():
+    pmf = hits_pmf(3000)
+    assert sum(pmf) == pytest.approx(1.0)
+    assert sum(k * p for k, p in enumerate(pmf)) == pytest.approx(1000.0)
+
+
+def test_margin_pmf_sums_to_one():
+    assert sum(margin_pmf(7, 5).values()) == pytest.approx(1.0)
+
+
+def test_exact_odds_with_huge_bonus():
+    state = DebateState(registry["Luther"], registry["Eck"], True,
+                        modifiers=DebateModifiers(protestant_bonus=2000))
+    odds = exact_odds(state)
+    assert odds.p_protestant_win == pytest.approx(1.0)
+
+
+def test_cached_margin_pmf_is_read_only():
+    odds = exact_odds(DebateState(registry["Luther"], registry["Eck"], True))
+    with pytest.raises(TypeError):
+        odds.margin_probs[0] = 1.0
+    assert sum(margin_pmf(7, 5).values()) == pytest.approx(1.0)
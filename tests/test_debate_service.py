@@ -0,0 +1,79 @@
+import asyncio
+import threading
+
+import pytest
+
+import debate_service
+from debate_service import DebateService, ServiceClient
+from debate_odds import exact_odds
+from scenarios import ScenarioError, scenario_state
+
+LUTHER_ECK = {"attacker": "Luther", "defender": "Eck"}
+ECK_LUTHER = {"attacker": "Eck", "defender": "Luther"}
+
+
+async def _cancel_tasks(tasks):
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@pytest.fixture
+def client():
+    """A ServiceClient talking to a service on a free localhost port."""
+    loop = asyncio.new_event_loop()
+    service = DebateService(seed=1)
+    server = loop.run_until_complete(service.start("127.0.0.1", 0))
+    port = server.sockets[0].getsockname()[1]
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    client = ServiceClient("127.0.0.1", port)
+    yield client
+    client.close()
+    loop.call_soon_threadsafe(server.close)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    # Let the connection handlers finish before the loop goes away
+    loop.run_until_complete(_cancel_tasks(asyncio.all_tasks(loop)))
+    loop.close()
+
+
+def test_round_trip(client):
+    record = client.odds({"id": "a", **LUTHER_ECK})
+    odds = exact_odds(scenario_state(LUTHER_ECK))
+    assert record["id"] == "a"
+    assert record["p_protestant_win"] == pytest.approx(odds.p_protestant_win)
+
+    records = client.resolve([LUTHER_ECK, {"attacker": "Luther"}, ECK_LUTHER])
+    assert [r["attacker"] for r in (records[0], records[2])] == ["Luther", "Eck"]
+    assert "error" in records[1]
+
+    client.odds(LUTHER_ECK)
+    health = client.health()
+    assert health["ok"] and health["cache_hits"] >= 1
+
+
+def test_out_of_range_bonus_is_an_error_record(client):
+    records = client.odds([{**LUTHER_ECK, "papal_bonus": 10**9}, LUTHER_ECK])
+    assert "papal_bonus" in records[0]["error"]
+    assert "error" not in records[1]
+
+
+def test_bad_path_raises(client):
+    with pytest.raises(ScenarioError):
+        client.request("POST", "/nowhere", {})
+
+
+def test_failing_scenario_does_not_fail_its_batch(monkeypatch):
+    def exact_odds_failing_for_eck_attacks(state):
+        if not state.protestant_attacking:
+            raise RuntimeError("boom")
+        return exact_odds(state)
+
+    monkeypatch.setattr(debate_service, "exact_odds", exact_odds_failing_for_eck_attacks)
+    service = DebateService()
+    records = service.compute("odds", [LUTHER_ECK, ECK_LUTHER, {"id": 3, **LUTHER_ECK}])
+    assert records[1] == {"error": "RuntimeError: boom"}
+    assert "error" not in records[0] and records[2]["id"] == 3
+    # Failures are not cached
+    assert len(service.odds_cache) == 1
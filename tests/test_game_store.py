@@ -0,0 +1,149 @@
+import json
+import os
+import random
+
+import pytest
+
+from debate_engine import DebateModifiers, DebateState, resolve_debate
+from debaters import registry
+from game_store import GameState, GameStore, debate_record, load_game
+from roster import RosterArrays
+from rules import DEFAULT_RULES, RuleSet
+
+
+def new_game(tmp_path):
+    path = str(tmp_path / "game.jsonl")
+    store = GameStore.create(path, GameState(RosterArrays(), turn=2, events=["augsburg"]))
+    return path, store
+
+
+def test_round_trip(tmp_path):
+    path, store = new_game(tmp_path)
+    store.record_available("Zwingli", False)
+    store.record_committed("Luther", True)
+    store.record_turn(3)
+    store.record_events(["mary", "eck_gardiner"])
+    store.close()
+
+    game = load_game(path)
+    reg = game.roster.registry
+    assert not game.roster.available[reg.row_of("Zwingli")]
+    assert game.roster.committed[reg.row_of("Luther")]
+    assert (game.turn, game.events) == (3, ["mary", "eck_gardiner"])
+
+
+def test_unknown_debater_in_event(tmp_path):
+    path, store = new_game(tmp_path)
+    store.record_available("Zwingli2", False)
+    store.close()
+    with pytest.raises(ValueError, match="Unknown debater 'Zwingli2'"):
+        load_game(path)
+
+
+def test_unknown_debater_in_snapshot(tmp_path):
+    path = tmp_path / "game.jsonl"
+    snapshot = GameState(RosterArrays()).snapshot()
+    snapshot["available"].append("Nobody")
+    path.write_text(json.dumps(snapshot) + "\n")
+    with pytest.raises(ValueError, match="Unknown debater 'Nobody'"):
+        load_game(str(path))
+
+
+def test_torn_last_line_is_dropped(tmp_path):
+    path, store = new_game(tmp_path)
+    store.record_turn(4)
+    store.close()
+    with open(path, "a") as f:
+        f.write('{"t":"turn","tu')  # crash mid-append
+
+    assert load_game(path).turn == 4
+    store, game = GameStore.open(path)
+    store.record_turn(5)
+    store.close()
+    assert load_game(path).turn == 5
+
+
+def test_corrupt_middle_line_is_an_error(tmp_path):
+    path, store = new_game(tmp_path)
+    store.close()
+    with open(path, "a") as f:
+        f.write('{"t":"turn",\n{"t":"turn","turn":3}\n')
+    with pytest.raises(ValueError):
+        load_game(path)
+
+
+def test_open_does_not_leak_on_failure(tmp_path, monkeypatch):
+    path, store = new_game(tmp_path)
+    store.record_available("Zwingli2", False)
+    store.close()
+    opened = []
+    monkeypatch.setattr(GameStore, "__init__", lambda self, p: opened.append(p))
+    with pytest.raises(ValueError):
+        GameStore.open(path)
+    assert opened == []
+
+
+def test_other_rules_are_rejected(tmp_path):
+    path, store = new_game(tmp_path)
+    store.close()
+    reordered = RuleSet(reversed(list(DEFAULT_RULES)), "reordered.json")
+    with pytest.raises(ValueError, match="different event rules"):
+        load_game(path, rules=reordered)
+    with pytest.raises(ValueError, match="different event rules"):
+        GameStore.open(path, rules=reordered)
+
+
+def test_unknown_event_is_rejected(tmp_path):
+    path, store = new_game(tmp_path)
+    store.record_events(["augsburg", "luther_bible"])
+    store.close()
+    with pytest.raises(ValueError, match="Unknown event 'luther_bible'"):
+        load_game(path)
+
+
+def play(store, game):
+    state = DebateState(registry["Luther"], registry["Eck"], True,
+                        modifiers=DebateModifiers(augsburg=True))
+    result = resolve_debate(state, random.Random(5))
+    store.record_debate(state, result)
+    game.apply(debate_record(state, result))
+
+
+def test_compact_round_trip(tmp_path):
+    path, store = new_game(tmp_path)
+    game = load_game(path)
+    play(store, game)
+    for name in ("Zwingli", "Bucer"):
+        store.record_available(name, False)
+        game.apply({"t": "available", "name": name, "value": False})
+    store.record_turn(4)
+    game.apply({"t": "turn", "turn": 4})
+    play(store, game)
+
+    store.compact(game)
+    store.record_committed("Luther", True)
+    store.close()
+
+    with open(path) as f:
+        assert len(f.readlines()) == 1 + 2 + 1  # snapshot, debates, the later append
+    loaded = load_game(path)
+    assert loaded.turn == 4 and loaded.events == ["augsburg"]
+    assert loaded.history == game.history
+    assert (loaded.roster.available == game.roster.available).all()
+    assert loaded.roster.committed[registry.row_of("Luther")]
+
+
+def test_failed_compact_keeps_the_journal(tmp_path):
+    path, store = new_game(tmp_path)
+    game = load_game(path)
+    play(store, game)
+    before = open(path).read()
+    game.history.append({"t": "debate", "bad": object()})
+
+    with pytest.raises(TypeError):
+        store.compact(game)
+    assert open(path).read() == before
+    assert not os.path.exists(f"{path}.tmp")
+    store.record_turn(6)
+    store.close()
+    assert load_game(path).turn == 6
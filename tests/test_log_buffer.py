@@ -0,0 +1,52 @@
+from log_buffer import LogBuffer
+
+
+def test_cap_keeps_the_newest_lines():
+    buffer = LogBuffer(3)
+    assert buffer.extend(["a", "b"]) == 0
+    assert buffer.extend(["c", "d"]) == 1
+    assert buffer.lines() == ["b", "c", "d"]
+    assert buffer.dropped == 1
+
+
+def test_batch_longer_than_the_cap():
+    buffer = LogBuffer(3)
+    buffer.extend(["a"])
+    assert buffer.evictions(5) == (1, 3)
+    assert buffer.extend(["1", "2", "3", "4", "5"]) == 3
+    assert buffer.lines() == ["3", "4", "5"]
+    assert buffer.dropped == 3
+
+
+def test_drop_oldest_counts_what_it_removes():
+    buffer = LogBuffer(5)
+    buffer.extend(["a", "b"])
+    buffer.drop_oldest(4)
+    assert len(buffer) == 0 and buffer.dropped == 2
+
+
+def test_unbounded():
+    buffer = LogBuffer(None)
+    buffer.extend(str(i) for i in range(1000))
+    assert len(buffer) == 1000 and buffer.dropped == 0
+    assert buffer.evictions(10) == (0, 10)
+
+
+def test_clear_resets_dropped():
+    buffer = LogBuffer(1)
+    buffer.extend(["a", "b"])
+    buffer.clear()
+    assert len(buffer) == 0 and buffer.dropped == 0
+
+
+def test_export_header(tmp_path):
+    buffer = LogBuffer(2)
+    buffer.extend(["a", "b", "c"])
+    path = tmp_path / "log.txt"
+    buffer.export(str(path))
+    assert path.read_text() == "[1 earlier line(s) dropped by the 2-line cap]\nb\nc\n"
+
+    buffer = LogBuffer(2)
+    buffer.extend(["a"])
+    buffer.export(str(path))
+    assert path.read_text() == "a\n"
@@ -0,0 +1,31 @@
+import numpy as np
+
+from campaign import CampaignSettings, run_campaigns
+from debate_engine import DebateState
+from debaters import registry
+from parallel import parallel_estimate_odds, parallel_run_campaigns
+
+
+def assert_same_summary(a, b):
+    np.testing.assert_array_equal(a.protestant_spaces, b.protestant_spaces)
+    np.testing.assert_array_equal(a.catholic_spaces, b.catholic_spaces)
+    np.testing.assert_array_equal(a.entered_counts, b.entered_counts)
+    np.testing.assert_array_equal(a.eliminated_counts, b.eliminated_counts)
+
+
+def test_campaigns_do_not_depend_on_worker_count():
+    settings = CampaignSettings(optional_debaters=["Cranmer"])
+    serial = run_campaigns(120, settings, seed=7)
+    for workers in (1, 4):
+        summary = parallel_run_campaigns(120, settings, seed=7, workers=workers, shard_size=25)
+        assert_same_summary(summary, serial)
+
+
+def test_estimates_do_not_depend_on_worker_count():
+    state = DebateState(registry["Luther"], registry["Eck"], True)
+    one, three = (parallel_estimate_odds(state, trials=300_000, seed=11, workers=workers,
+                                         shard_trials=50_000)
+                  for workers in (1, 3))
+    assert one.trials == three.trials == 300_000
+    assert (one.p_protestant_win, one.p_papal_disgraced, one.expected_margin) == \
+        (three.p_protestant_win, three.p_papal_disgraced, three.expected_margin)
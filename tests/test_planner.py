@@ -0,0 +1,29 @@
+from planner import TurnPlanner, rules_signature
+from roster import RosterArrays
+
+
+def test_order_follows_the_most_likely_line():
+    roster = RosterArrays()
+    planner = TurnPlanner(roster, True)
+    plan = planner.plan(3)
+    assert plan.next_call is plan.order[0]
+    assert len({d.name for d in plan.order}) == len(plan.order) <= 3
+
+    # Play the first call against the likeliest defender, which stays in play
+    # committed, and re-plan: the next call is of the kind the plan listed
+    attacker_row = roster.row_of(plan.order[0])
+    available = planner._to_bits(roster.available)
+    committed = planner._to_bits(roster.committed) | 1 << attacker_row
+    attackers, fresh, used = planner.state_counts(available, committed)
+    j = max(range(len(fresh)), key=lambda j: fresh[j])
+    free = available & ~committed
+    defender_row = next(r for r in planner.defender_classes[j] if free >> r & 1)
+    attacker_class = next(i for i, rows in enumerate(planner.attacker_classes)
+                          if attacker_row in rows)
+    _, p_out = planner.pair_odds[attacker_class][j][False]
+    assert p_out < 0.5
+    committed |= 1 << defender_row
+
+    replanned = planner.plan(2, available, committed)
+    assert (rules_signature(replanned.next_call, planner.modifiers)
+            == rules_signature(plan.order[1], planner.modifiers))
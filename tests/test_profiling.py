@@ -0,0 +1,60 @@
+import json
+import os
+
+import pytest
+
+import profiling
+
+
+@pytest.fixture
+def fresh(monkeypatch):
+    """Profiling off, with enable()'s global changes undone after the test."""
+    for name in ("profiler", "span", "count"):
+        monkeypatch.setattr(profiling, name, getattr(profiling, name))
+    monkeypatch.setattr(profiling, "profiler", None)
+    monkeypatch.setattr(profiling.atexit, "register", lambda func: None)
+    monkeypatch.setenv(profiling.MAIN_PID_ENV_VAR, str(os.getpid()))
+    return profiling
+
+
+def test_traced_is_a_no_op_when_off(fresh):
+    def work(x):
+        return x + 1
+
+    assert fresh.traced("test.work")(work) is work
+    assert fresh.span("test.block") is fresh.span("test.other")
+
+
+def test_enable_records_spans_and_counters(fresh):
+    profiler = fresh.enable("stats")
+    assert fresh.enable("stats") is profiler
+
+    @fresh.traced("test.work")
+    def work(x):
+        return x * 2
+
+    assert [work(i) for i in range(3)] == [0, 2, 4]
+    with fresh.span("test.block"):
+        fresh.count("test.items", 5)
+    fresh.count("test.items")
+
+    stats = profiler.stats()
+    assert stats["spans"]["test.work"]["calls"] == 3
+    assert stats["spans"]["test.block"]["calls"] == 1
+    assert stats["counters"] == {"test.items": 6}
+
+
+def test_write_trace(fresh, tmp_path):
+    path = tmp_path / "trace.json"
+    profiler = fresh.enable(str(path))
+    assert profiler.trace_path == str(path)
+    with fresh.span("test.block"):
+        fresh.count("test.items", 2)
+    profiler.finish()
+
+    trace = json.loads(path.read_text())
+    (event,) = trace["traceEvents"]
+    assert (event["name"], event["cat"], event["ph"]) == ("test.block", "test", "X")
+    assert event["dur"] >= 0 and event["pid"] == os.getpid()
+    assert trace["otherData"]["counters"] == {"test.items": 2}
+    assert trace["otherData"]["dropped_events"] == 0
@@ -0,0 +1,26 @@
+import pytest
+
+from debate_engine import DebateModifiers
+from rules import RESERVED_IDS, RuleSet, RulesError
+
+
+def spec(**fields):
+    return {"id": "home_turf", "side": "protestant", "dice": 1, **fields}
+
+
+@pytest.mark.parametrize("when", ["German", ["German"], 3])
+def test_when_must_be_an_object(when):
+    with pytest.raises(RulesError, match="when must be a JSON object"):
+        RuleSet.from_specs([spec(when=when)])
+
+
+@pytest.mark.parametrize("rule_id", RESERVED_IDS)
+def test_reserved_ids_are_rejected(rule_id):
+    with pytest.raises(RulesError, match="reserved"):
+        RuleSet.from_specs([spec(id=rule_id)])
+
+
+def test_custom_rule_as_event_keyword():
+    rules = RuleSet.from_specs([spec(when={"protestant_zone": "German"})])
+    modifiers = DebateModifiers(rules=rules, home_turf=True)
+    assert modifiers.flags == rules.flag("home_turf")
@@ -0,0 +1,16 @@
+import pytest
+
+from debate_engine import DebateModifiers
+from matchup_table import build_matchup_table
+from zone_sweep import sweep_zones
+
+
+@pytest.mark.parametrize("flags", [0, 0b00010, 0b11111])
+def test_sweep_from_table_matches_computed(flags):
+    modifiers = DebateModifiers.from_flags(flags)
+    computed = [row.record() for row in sweep_zones(modifiers=modifiers)]
+    cached = [row.record() for row in sweep_zones(modifiers=modifiers,
+                                                  table=build_matchup_table())]
+    assert len(cached) == len(computed)
+    for a, b in zip(cached, computed):
+        assert a == pytest.approx(b, abs=1e-6)
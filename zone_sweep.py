@@ -0,0 +1,213 @@
+"""
+Debate outcomes for every language zone and turn in one pass.
+
+For each Protestant zone (German, English, French), each turn and each
+attacking side, the sweep averages the exact odds over the debates the GUI
+could pick there: a uniformly random available attacker (in play by that
+turn) against a uniformly random available defender. Papal debaters debate
+in every zone, as in the table filter.
+
+Every Protestant x Papal pairing is worked out once per attacking side,
+with the same fields as the matchup table: read from a MatchupTable when
+one covers the modifiers, otherwise from matchup_table.matchup_cells (a few
+milliseconds for the whole roster). Each zone/turn cell is then a masked
+mean over the pairing matrix.
+
+    python zone_sweep.py --events mary eck_gardiner
+"""
+import argparse
+import json
+import sys
+
+import numpy as np
+
+import profiling
+from debate_engine import DebateModifiers
+from debaters import ENGLISH, FRENCH, GERMAN
+from matchup_table import (EXPECTED_MARGIN, P_PAPAL_DISGRACED, P_PAPAL_WIN, P_PROTESTANT_BURNED,
+                           P_PROTESTANT_WIN, PAPAL_ATTACKS, PROTESTANT_ATTACKS, matchup_cells)
+from roster import RosterArrays
+from rules import DEFAULT_RULES, RulesError, load_rules
+
+PROTESTANT_ZONES = (GERMAN, ENGLISH, FRENCH)
+DEFAULT_TURNS = range(1, 10)
+
+
+def pairing_matrices(roster, modifiers, table=None):
+    """
+    {protestant_attacking: float array [protestant, papal, field]} over the
+    roster's Protestant and Papal rows (in roster order), for uncommitted
+    defenders.
+    """
+    registry = roster.registry
+    protestants = [registry.at_row(r) for r in np.flatnonzero(roster.protestant)]
+    papals = [registry.at_row(r) for r in np.flatnonzero(~roster.protestant)]
+    if table is not None and table.covers(modifiers):
+        try:
+            index = np.ix_(table.indices(protestants, True), table.indices(papals, False))
+        except KeyError:
+            pass
+        else:
+            return {side: table.table[modifiers.flags, direction, 0][index]
+                    for side, direction in ((True, PROTESTANT_ATTACKS), (False, PAPAL_ATTACKS))}
+    cells = matchup_cells(protestants, papals, modifiers)
+    return {True: cells[PROTESTANT_ATTACKS, 0], False: cells[PAPAL_ATTACKS, 0]}
+
+
+class SweepRow:
+    """Averaged outcomes for one zone, turn and attacking side."""
+
+    def __init__(self, zone, turn, protestant_attacking, attackers, defenders, stats,
+                 best_attacker, best_margin):
+        self.zone = zone
+        self.turn = turn
+        self.protestant_attacking = protestant_attacking
+        self.attackers = attackers  # number of debaters who could attack
+        self.defenders = defenders
+        self.stats = stats  # mean of each field, None if no debate is possible
+        self.best_attacker = best_attacker  # highest expected margin for its side
+        self.best_margin = best_margin
+
+    @property
+    def p_protestant_win(self):
+        return self.stats[P_PROTESTANT_WIN]
+
+    @property
+    def p_papal_win(self):
+        return self.stats[P_PAPAL_WIN]
+
+    @property
+    def p_papal_disgraced(self):
+        return self.stats[P_PAPAL_DISGRACED]
+
+    @property
+    def p_protestant_burned(self):
+        return self.stats[P_PROTESTANT_BURNED]
+
+    @property
+    def expected_margin(self):
+        return self.stats[EXPECTED_MARGIN]
+
+    def record(self):
+        """JSON-ready dict."""
+        record = {
+            "zone": self.zone,
+            "turn": self.turn,
+            "attacker": "Protestant" if self.protestant_attacking else "Papal",
+            "attackers": self.attackers,
+            "defenders": self.defenders,
+        }
+        if self.stats is not None:
+            record.update(
+                p_protestant_win=self.p_protestant_win,
+                p_papal_win=self.p_papal_win,
+                p_papal_disgraced=self.p_papal_disgraced,
+                p_protestant_burned=self.p_protestant_burned,
+                expected_margin=self.expected_margin,
+                best_attacker=self.best_attacker.name,
+                best_attacker_margin=self.best_margin,
+            )
+        return record
+
+
+@profiling.traced("sweep.sweep_zones")
+def sweep_zones(roster=None, modifiers=None, turns=DEFAULT_TURNS, zones=PROTESTANT_ZONES,
+                table=None):
+    """
+    SweepRows for every zone x turn x attacking side. Only the roster's
+    available debaters take part; committed flags are ignored. table is an
+    optional MatchupTable to read the pairings from.
+    """
+    roster = roster if roster is not None else RosterArrays()
+    modifiers = modifiers if modifiers is not None else DebateModifiers()
+    registry = roster.registry
+    protestant_rows = np.flatnonzero(roster.protestant)
+    papal_rows = np.flatnonzero(~roster.protestant)
+    matrices = pairing_matrices(roster, modifiers, table)
+
+    rows = []
+    for zone in zones:
+        for turn in turns:
+            mask = roster.visible_mask(zone, turn) & roster.available
+            protestant_index = np.flatnonzero(mask[protestant_rows])
+            papal_index = np.flatnonzero(mask[papal_rows])
+            for protestant_attacking in (True, False):
+                if protestant_attacking:
+                    attacker_index, attacker_rows = protestant_index, protestant_rows
+                    defenders = len(papal_index)
+                else:
+                    attacker_index, attacker_rows = papal_index, papal_rows
+                    defenders = len(protestant_index)
+                if not len(protestant_index) or not len(papal_index):
+                    rows.append(SweepRow(zone, turn, protestant_attacking, len(attacker_index),
+                                         defenders, None, None, None))
+                    continue
+
+                cells = matrices[protestant_attacking][np.ix_(protestant_index, papal_index)]
+                stats = tuple(cells.mean(axis=(0, 1), dtype=np.float64).tolist())
+                # Expected margin from the attacker's side, averaged over defenders
+                margins = cells[:, :, EXPECTED_MARGIN]
+                by_attacker = (margins.mean(axis=1, dtype=np.float64) if protestant_attacking
+                               else -margins.mean(axis=0, dtype=np.float64))
+                best = int(by_attacker.argmax())
+                rows.append(SweepRow(zone, turn, protestant_attacking, len(attacker_index),
+                                     defenders, stats,
+                                     registry.at_row(attacker_rows[attacker_index[best]]),
+                                     float(by_attacker[best])))
+    return rows
+
+
+def format_table(rows):
+    """Text table of SweepRows, one line each."""
+    lines = [f"{'Zone':<8}{'Turn':>5} {'Attacker':<11}{'Att':>4}{'Def':>4}"
+             f"{'Prot win':>9}{'Pap win':>9}{'Disgr.':>8}{'Burned':>8}{'E[margin]':>10}  Best attacker"]
+    for row in rows:
+        side = "Protestant" if row.protestant_attacking else "Papal"
+        head = f"{row.zone:<8}{row.turn:>5} {side:<11}{row.attackers:>4}{row.defenders:>4}"
+        if row.stats is None:
+            lines.append(f"{head}  (no debate possible)")
+            continue
+        lines.append(
+            f"{head}{row.p_protestant_win:>9.1%}{row.p_papal_win:>9.1%}"
+            f"{row.p_papal_disgraced:>8.1%}{row.p_protestant_burned:>8.1%}"
+            f"{row.expected_margin:>+10.2f}  {row.best_attacker.name} ({row.best_margin:+.2f})")
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Average debate odds for every language zone and turn.")
+    parser.add_argument("--events", nargs="*", default=[], help="rule ids of the events in play")
+    parser.add_argument("--rules", default=None,
+                        help="event modifier rules file (default: modifiers.json)")
+    parser.add_argument("--turns", type=int, default=len(DEFAULT_TURNS),
+                        help="sweep turns 1..TURNS (default: %(default)s)")
+    parser.add_argument("--optional", nargs="*", default=[],
+                        help="optional debaters brought into play")
+    parser.add_argument("--json", action="store_true", help="write JSON Lines instead of a table")
+    args = parser.parse_args(argv)
+
+    try:
+        rules = load_rules(args.rules) if args.rules else DEFAULT_RULES
+        modifiers = DebateModifiers(rules=rules, **{event: True for event in args.events})
+    except (OSError, RulesError, TypeError) as e:
+        parser.error(str(e))
+
+    roster = RosterArrays()
+    for name in args.optional:
+        row = roster.registry.row_of(name)
+        if row is None:
+            parser.error(f"Unknown debater: {name!r}")
+        roster.available[row] = True
+
+    rows = sweep_zones(roster, modifiers, turns=range(1, args.turns + 1))
+    if args.json:
+        for row in rows:
+            sys.stdout.write(json.dumps(row.record()) + "\n")
+    else:
+        print("\n".join(format_table(rows)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())